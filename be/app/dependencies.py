@@ -1,14 +1,25 @@
+import os
 from functools import lru_cache
 from app.services.aws_service import AWSService
 from app.services.email_service import EmailService
+from app.services.font_service import FontService
 from app.services.instagram_service import InstagramService
 from app.services.openai_service import OpenAIService
 from app.services.parser_service import ParserService
 from app.services.project_io_service import ProjectIoService
+from app.services.prompt_compaction_service import PromptCompactionService
+from app.services.s3_cleanup_service import S3CleanupService
+from app.services.scratch_workspace_service import ScratchWorkspaceService
+from app.services.slide_image_service import SlideImageService
 from app.services.stockly_service import StocklyService
 from app.services.terms_and_conditions_service import TermsAndConditionsService
+from app.services.text_layout_service import TextLayoutService
 from app.services.fetch_logo_service import FetchLogoService
 from app.services.alt_service.alt_service import AltService
+from app.services.company_metadata_service import CompanyMetadataService
+from app.services.http_client_service import HttpClientService
+from app.services.cache_service import ContentAddressedFileCache, PersistentTTLCache
+from app.settings import Settings
 from app.logic.automation_logic import AutomationLogic
 
 
@@ -25,23 +36,50 @@ def get_parser_service():
 
 
 def get_project_io_service():
-    return ProjectIoService()
+    return ProjectIoService(
+        http_client=get_http_client_singleton(),
+        font_service=get_font_service_singleton(),
+        text_layout_service=get_text_layout_service(),
+        logo_layer_cache=get_intro_logo_cache_singleton(),
+    )
+
+
+def get_text_layout_service():
+    return TextLayoutService(font_service=get_font_service_singleton())
+
+
+def get_prompt_compaction_service():
+    return PromptCompactionService()
 
 
 def get_openai_service():
-    return OpenAIService()
+    return OpenAIService(
+        http_client=get_http_client_singleton(),
+        analysis_cache=get_analysis_cache_singleton(),
+    )
 
 
 def get_instagram_service():
-    return InstagramService()
+    return InstagramService(http_client=get_http_client_singleton())
 
 
 def get_aws_service():
-    return AWSService()
+    return get_aws_service_singleton()
 
 
 def get_fetch_logo_service():
-    return FetchLogoService()
+    return FetchLogoService(
+        http_client=get_http_client_singleton(),
+        logo_cache=get_logo_cache_singleton(),
+    )
+
+
+def get_slide_image_service():
+    return SlideImageService(
+        openai_service=get_openai_service(),
+        project_io_service=get_project_io_service(),
+        image_cache=get_generated_image_cache_singleton(),
+    )
 
 
 def get_stockly_service():
@@ -53,6 +91,11 @@ def get_stockly_service():
         aws_service=get_aws_service(),
         instagram_service=get_instagram_service(),
         fetch_logo_service=get_fetch_logo_service(),
+        http_client=get_http_client_singleton(),
+        prompt_compaction_service=get_prompt_compaction_service(),
+        scratch_workspace_service=get_scratch_workspace_service_singleton(),
+        slide_image_service=get_slide_image_service(),
+        s3_cleanup_service=get_s3_cleanup_service_singleton(),
     )
 
 
@@ -64,6 +107,8 @@ def get_alt_service():
     return AltService(
         project_io_service=get_project_io_service(),
         aws_service=get_aws_service(),
+        http_client=get_http_client_singleton(),
+        scratch_workspace_service=get_scratch_workspace_service_singleton(),
     )
 
 
@@ -76,3 +121,90 @@ def get_alt_service():
 def get_automation_logic_singleton() -> AutomationLogic:
     """Singleton AutomationLogic instance."""
     return AutomationLogic()
+
+
+@lru_cache(maxsize=1)
+def get_company_metadata_service_singleton() -> CompanyMetadataService:
+    """Singleton CompanyMetadataService instance, shared so its cache is process-wide."""
+    return CompanyMetadataService()
+
+
+@lru_cache(maxsize=1)
+def get_http_client_singleton() -> HttpClientService:
+    """Singleton HttpClientService instance, so every service shares one connection pool."""
+    return HttpClientService()
+
+
+@lru_cache(maxsize=1)
+def get_scratch_workspace_service_singleton() -> ScratchWorkspaceService:
+    """Singleton ScratchWorkspaceService instance, so the disk-usage cap is process-wide."""
+    return ScratchWorkspaceService()
+
+
+@lru_cache(maxsize=1)
+def get_font_service_singleton() -> FontService:
+    """Singleton FontService instance, so loaded fonts are shared across requests."""
+    return FontService()
+
+
+@lru_cache(maxsize=1)
+def get_intro_logo_cache_singleton() -> PersistentTTLCache:
+    """Singleton cache of resized company logos for the intro slide."""
+    settings = Settings().get_settings()
+    return PersistentTTLCache(
+        name="intro_logo",
+        ttl_seconds=int(settings.INTRO_LOGO_CACHE_TTL_SECONDS),
+        max_entries=int(settings.INTRO_LOGO_CACHE_MAX_ENTRIES),
+        db_path=os.path.join(settings.CACHE_DIR, "stockly_cache.sqlite3"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_aws_service_singleton() -> AWSService:
+    """Singleton AWSService instance, so every service shares one S3 client and pool."""
+    return AWSService()
+
+
+@lru_cache(maxsize=1)
+def get_s3_cleanup_service_singleton() -> S3CleanupService:
+    """Singleton background deleter of temporary S3 objects."""
+    settings = Settings().get_settings()
+    return S3CleanupService(
+        aws_service=get_aws_service(),
+        db_path=os.path.join(settings.CACHE_DIR, "stockly_cache.sqlite3"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_logo_cache_singleton() -> PersistentTTLCache:
+    """Singleton cache of company logo URLs and images, keyed by company."""
+    settings = Settings().get_settings()
+    return PersistentTTLCache(
+        name="company_logo",
+        ttl_seconds=int(settings.LOGO_CACHE_TTL_SECONDS),
+        max_entries=int(settings.LOGO_CACHE_MAX_ENTRIES),
+        db_path=os.path.join(settings.CACHE_DIR, "stockly_cache.sqlite3"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_analysis_cache_singleton() -> PersistentTTLCache:
+    """Singleton cache of written stock analyses, shared by every OpenAIService."""
+    settings = Settings().get_settings()
+    return PersistentTTLCache(
+        name="written_analysis",
+        ttl_seconds=int(settings.ANALYSIS_CACHE_TTL_SECONDS),
+        max_entries=int(settings.ANALYSIS_CACHE_MAX_ENTRIES),
+        db_path=os.path.join(settings.CACHE_DIR, "stockly_cache.sqlite3"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_generated_image_cache_singleton() -> ContentAddressedFileCache:
+    """Singleton cache of generated slide images, keyed by prompt hash."""
+    settings = Settings().get_settings()
+    return ContentAddressedFileCache(
+        name="generated_images",
+        directory=os.path.join(settings.CACHE_DIR, "generated_images"),
+        max_bytes=int(settings.GENERATED_IMAGE_CACHE_MAX_BYTES),
+    )
@@ -0,0 +1,25 @@
+from fastapi import status
+
+from app.errors.base_error import StocklyError
+
+
+class LogoNotFoundError(StocklyError):
+    """
+    Error for case where Google Images has no usable logo for a company.
+
+    Unlike network errors, this answer is worth caching for a while.
+
+    Parameters
+    ----------
+    StocklyError : stockly error
+        base stockly error.
+    """
+
+    error_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    error_message: str
+
+    def __init__(self, error_message: str):
+        super().__init__(
+            errors={"fetch_logo": [error_message]}, error_code=self.error_code
+        )
+        self.error_message = error_message
@@ -0,0 +1,39 @@
+"""
+Fill the company logo cache for every stock the automation posts about.
+
+Run before deploying or from a cron job, so posts read logos from the cache
+instead of scraping Google Images. Companies that are already cached are
+skipped.
+
+Usage (from `be/`):
+    python -m app.logic.warm_logo_cache
+    python -m app.logic.warm_logo_cache --ticker NASDAQ:AAPL --ticker NYSE:KO
+"""
+
+import argparse
+
+from app.dependencies import get_automation_logic_singleton, get_fetch_logo_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--ticker",
+        metavar="EXCHANGE:TICKER",
+        action="append",
+        help="warm only these stocks (repeatable), by default every listed stock",
+    )
+    args = parser.parse_args()
+
+    company_names = args.ticker or [
+        stock.full_name for stock in get_automation_logic_singleton().stock_requests
+    ]
+    counts = get_fetch_logo_service().warm_up(company_names)
+    print(
+        f"{len(company_names)} stocks: {counts['cached']} already cached, "
+        f"{counts['fetched']} fetched, {counts['failed']} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
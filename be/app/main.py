@@ -8,8 +8,15 @@ from contextlib import asynccontextmanager
 
 from app.logging_config import configure_logging, get_logger
 from app.routes import api_routes, dev_routes
+from app.services.project_io_service import load_background_image
 from app.settings import MODE, Settings
-from app.dependencies import get_automation_logic_singleton
+from app.dependencies import (
+    get_automation_logic_singleton,
+    get_aws_service_singleton,
+    get_font_service_singleton,
+    get_http_client_singleton,
+    get_s3_cleanup_service_singleton,
+)
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from app.settings import Settings
@@ -67,7 +74,15 @@ async def lifespan(app: FastAPI):
     """Use FastAPI lifespan to perform startup/shutdown tasks."""
     _ = get_automation_logic_singleton()
     get_logger(__name__).info("AltService singleton initialized on startup")
+    _ = get_http_client_singleton()
+    _ = get_aws_service_singleton()
+    _ = get_font_service_singleton()
+    _ = load_background_image(Settings().get_settings().BACKGROUND_IMAGE_PATH)
+    # drains deletes left over from a previous run
+    get_s3_cleanup_service_singleton().start()
     yield
+    get_s3_cleanup_service_singleton().stop()
+    get_http_client_singleton().close()
 
 
 settings = Settings().get_settings()
@@ -0,0 +1,14 @@
+from PIL import Image
+from pydantic import BaseModel, ConfigDict
+
+
+class SlideRenderRequest(BaseModel):
+    """A carousel slide image and the text to draw on it."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    image: Image.Image
+    text: str = ""
+    bolded_text: str = ""
+    # 'stroke' or 'band'; None uses TEXT_READABILITY
+    readability: str | None = None
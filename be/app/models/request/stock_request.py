@@ -1,4 +1,3 @@
-import yfinance as yf
 from pydantic import BaseModel
 
 
@@ -13,6 +12,6 @@ class StockRequestInfo(BaseModel):
     @property
     def long_name(self) -> str:
         """Return long name of stock."""
+        from app.dependencies import get_company_metadata_service_singleton
 
-        ticker = yf.Ticker(self.ticker)
-        return ticker.info.get("longName", "Unknown Stock")
+        return get_company_metadata_service_singleton().get_long_name(self.ticker)
@@ -1,4 +1,7 @@
+from typing import Iterator
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import (
     get_alt_service,
@@ -6,12 +9,14 @@ from app.dependencies import (
     get_stockly_service,
 )
 from app.errors.base_error import StocklyError
+from app.logging_config import get_logger
 from app.models.request.send_briefing_email_request import SendEmailRequest
 from app.models.request.stock_request import StockRequestInfo
 from app.models.response.base_response import ErrorResponse, SuccessResponse
 from app.services.stockly_service import StocklyService
 
 router = APIRouter()
+logger = get_logger(__name__)
 
 
 @router.get("/")
@@ -78,6 +83,48 @@ def stock_analysis(
         return ErrorResponse(error_code=e.error_code, error_message=str(e))
 
 
+def _to_sse(data: str, event: str | None = None) -> str:
+    """Frame a chunk of text as a Server-Sent Event."""
+    lines = [f"event: {event}"] if event else []
+    lines += [f"data: {line}" for line in data.split("\n")]
+    return "\n".join(lines) + "\n\n"
+
+
+@router.post(
+    path="/stock_analysis/stream",
+    dependencies=[Depends(get_stockly_service)],
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+def stock_analysis_stream(
+    stock: StockRequestInfo,
+    stockly_service: StocklyService = Depends(get_stockly_service),
+):
+    """
+    Stream the stock analysis for a given stock request as Server-Sent Events.
+
+    Each `data` event carries a text delta; a final `done` event ends the stream
+    and an `error` event is sent if the analysis fails.
+    """
+
+    def event_stream() -> Iterator[str]:
+        try:
+            for chunk in stockly_service.stream_stock_analysis(stock):
+                yield _to_sse(chunk)
+            yield _to_sse("", event="done")
+        except StocklyError as e:
+            yield _to_sse(str(e), event="error")
+        except Exception as e:
+            # the 200 status is already sent, so report the failure in-stream
+            logger.error(f"Streaming analysis of {stock.full_name} failed: {e}")
+            yield _to_sse("An unexpected error occurred.", event="error")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     path="/auto_stockly_post",
     dependencies=[Depends(get_stockly_service)],
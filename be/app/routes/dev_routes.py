@@ -1,10 +1,19 @@
 from fastapi import APIRouter, Depends
 
 from app.dependencies import (
+    get_analysis_cache_singleton,
     get_automation_logic_singleton,
     get_aws_service,
+    get_company_metadata_service_singleton,
+    get_font_service_singleton,
+    get_generated_image_cache_singleton,
+    get_http_client_singleton,
+    get_intro_logo_cache_singleton,
     get_instagram_service,
+    get_logo_cache_singleton,
     get_openai_service,
+    get_s3_cleanup_service_singleton,
+    get_scratch_workspace_service_singleton,
 )
 from app.errors.base_error import StocklyError
 from app.models.request.aws_service_request import (
@@ -114,3 +123,57 @@ def upload_carousel_to_instagram(s3_object_names: list[str], caption: str = ""):
             return SuccessResponse(data="Carousel uploaded to Instagram successfully.")
     except StocklyError as e:
         return ErrorResponse(error_code=e.error_code, error_message=str(e))
+
+
+@router.get(
+    path="/cache_stats",
+    responses={200: {"model": SuccessResponse}},
+)
+def cache_stats():
+    """
+    (Dev-only) Hit/miss counters of the process-wide caches.
+    """
+    return SuccessResponse(
+        data={
+            "company_metadata": get_company_metadata_service_singleton().stats(),
+            "written_analysis": get_analysis_cache_singleton().stats(),
+            "company_logo": get_logo_cache_singleton().stats(),
+            "intro_logo": get_intro_logo_cache_singleton().stats(),
+            "generated_images": get_generated_image_cache_singleton().stats(),
+            "fonts": get_font_service_singleton().stats(),
+            "scratch": get_scratch_workspace_service_singleton().stats(),
+        }
+    )
+
+
+@router.get(
+    path="/http_pool_stats",
+    responses={200: {"model": SuccessResponse}},
+)
+def http_pool_stats():
+    """
+    (Dev-only) Per-host request and connection counters of the shared HTTP client.
+    """
+    return SuccessResponse(data=get_http_client_singleton().stats())
+
+
+@router.get(
+    path="/s3_cleanup_stats",
+    responses={200: {"model": SuccessResponse}},
+)
+def s3_cleanup_stats():
+    """
+    (Dev-only) Backlog and counters of the background S3 cleanup.
+    """
+    return SuccessResponse(data=get_s3_cleanup_service_singleton().stats())
+
+
+@router.get(
+    path="/aws_stats",
+    responses={200: {"model": SuccessResponse}},
+)
+def aws_stats():
+    """
+    (Dev-only) Construction time and count of the process's S3 clients.
+    """
+    return SuccessResponse(data=get_aws_service().stats())
@@ -15,8 +15,13 @@ from app.errors.external_api_error import ExternalServiceError
 from app.models.request.aws_service_request import UploadImageRequest
 from app.models.request.instagram_service_request import InstagramImageRequest
 from app.services.aws_service import AWSService
+from app.services.http_client_service import HttpClientService
 from app.services.instagram_service import InstagramService
 from app.services.project_io_service import ProjectIoService
+from app.services.scratch_workspace_service import (
+    ScratchWorkspace,
+    ScratchWorkspaceService,
+)
 
 logger = get_logger(__name__)
 
@@ -26,9 +31,13 @@ class AltService:
         self,
         project_io_service: ProjectIoService,
         aws_service: AWSService,
+        http_client: HttpClientService,
+        scratch_workspace_service: ScratchWorkspaceService,
     ):
         self.project_io_service = project_io_service
+        self.scratch_workspace_service = scratch_workspace_service
         self.aws_service = aws_service
+        self.http_client = http_client
         self.settings = Settings().get_settings()
         self.deepseek_client = OpenAI(
             api_key=self.settings.DEEPSEEK_KEY, base_url="https://api.deepseek.com"
@@ -94,7 +103,11 @@ class AltService:
                 logger.error(f"Failed to hit Gemini API after 3 retries: {e}")
                 raise ExternalServiceError("Failed to generate image after retries")
 
-    def generate_image(self, output_filepath: str = "alt_service_generated_image.png"):
+    def generate_image(
+        self,
+        workspace: ScratchWorkspace,
+        output_filename: str = "alt_service_generated_image.png",
+    ):
         client = genai.Client(api_key=self.settings.GEMINI_KEY)
 
         top_colour = random.choice(self.TOP_COLOURS)
@@ -110,6 +123,7 @@ class AltService:
         example_image_filepath = self.project_io_service.download_image(
             image_url=f"https://{self.settings.ALT_S3_BUCKET_NAME}.s3.{self.settings.AWS_REGION}.amazonaws.com/{example_image_s3_object}",
             filename=f"alt_service_example_image_{example_image_s3_object}.png",
+            workspace=workspace,
         )
 
         response: types.GenerateContentResponse = self._hit_gemini_api(
@@ -124,27 +138,27 @@ class AltService:
                 elif part.inline_data is not None:
                     image = part.as_image()
                     if image:
-                        # Cleanup
-                        self.project_io_service.delete_file(example_image_filepath)
-
+                        output_filepath = workspace.path(output_filename)
                         image.save(output_filepath)
-                        return output_filepath
+                        return workspace.track(output_filepath)
 
         raise ExternalServiceError("Failed to generate image")
 
     def create_ig_post(self):
         caption = self.generate_caption()
-        image_filepath = self.generate_image()
+        with self.scratch_workspace_service.workspace() as workspace:
+            image_filepath = self.generate_image(workspace)
 
-        image_s3_object = self.aws_service.upload_file(
-            UploadImageRequest(
-                file_path=image_filepath, bucket=self.settings.AWS_BUCKET_NAME
+            image_s3_object = self.aws_service.upload_file(
+                UploadImageRequest(
+                    file_path=image_filepath, bucket=self.settings.AWS_BUCKET_NAME
+                )
             )
-        )
 
         logger.info("Publishing to Instagram...")
 
         instagram_service = InstagramService(
+            http_client=self.http_client,
             user_id=self.settings.INSTA_ALT_USER_ID,
             access_token=self.settings.INSTA_ALT_ACCESS_TOKEN,
         )
@@ -156,7 +170,4 @@ class AltService:
             )
         )
 
-        # Cleanup
-        self.project_io_service.delete_file(image_filepath)
-
         logger.info(f"Published Instagram post with ID: {instagram_id}")
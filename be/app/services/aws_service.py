@@ -1,27 +1,79 @@
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
 from app.models.request.aws_service_request import (
     DeleteImageRequest,
     UploadImageRequest,
 )
+from app.logging_config import get_logger
 from app.models.response.aws_service_response import S3StorageObject
 from app.settings import Settings
 
+logger = get_logger(__name__)
+
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
+# S3 clients built by this process; more than one means the client is no longer
+# shared (see get_aws_service_singleton)
+_client_metrics_lock = threading.Lock()
+_client_metrics = {"clients_created": 0, "last_init_ms": 0.0, "total_init_ms": 0.0}
+
+
+def build_transfer_config() -> TransferConfig:
+    """Transfer settings for S3 uploads, from the S3_* settings."""
+    settings = Settings().get_settings()
+    return TransferConfig(
+        max_concurrency=int(settings.S3_TRANSFER_MAX_CONCURRENCY),
+        multipart_threshold=int(settings.S3_MULTIPART_THRESHOLD_BYTES),
+        multipart_chunksize=int(settings.S3_MULTIPART_CHUNKSIZE_BYTES),
+    )
+
 
 class AWSService:
     """
     Service for interacting with AWS.
+
+    Building the boto3 client is expensive (endpoint and service model loading),
+    and the client owns the connection pool, so the service is meant to be used
+    as a process-wide singleton. boto3 clients are thread-safe.
+
+    Parameters
+    ----------
+    transfer_config : TransferConfig | None, optional
+        transfer settings of every upload, by default `build_transfer_config()`
     """
 
-    def __init__(self) -> None:
+    def __init__(self, transfer_config: TransferConfig | None = None) -> None:
         settings = Settings().get_settings()
+        self.upload_concurrency = max(1, int(settings.S3_UPLOAD_CONCURRENCY))
+        self.transfer_config = transfer_config or build_transfer_config()
+
+        start = time.perf_counter()
         self.s3 = boto3.client(
             "s3",
             aws_access_key_id=settings.AWS_ACCESS_KEY,
             aws_secret_access_key=settings.AWS_SECRET,
             region_name=settings.AWS_REGION,
+            # room for every concurrent upload of a batch and its parts
+            config=Config(max_pool_connections=int(settings.S3_MAX_POOL_CONNECTIONS)),
+        )
+        self.client_init_ms = (time.perf_counter() - start) * 1000
+        with _client_metrics_lock:
+            _client_metrics["clients_created"] += 1
+            _client_metrics["last_init_ms"] = self.client_init_ms
+            _client_metrics["total_init_ms"] += self.client_init_ms
+            clients_created = _client_metrics["clients_created"]
+        logger.info(
+            f"S3 client created in {self.client_init_ms:.1f} ms "
+            f"({clients_created} in this process)"
         )
 
     def upload_file(self, param: UploadImageRequest) -> S3StorageObject:
@@ -43,10 +95,88 @@ class AWSService:
             s3 object
         """
         object_name = uuid.uuid4().hex
-        self.s3.upload_file(param.file_path, param.bucket, object_name)
+        self.s3.upload_file(
+            param.file_path, param.bucket, object_name, Config=self.transfer_config
+        )
 
         return S3StorageObject(object_name=object_name, bucket=param.bucket)
 
+    def upload_fileobj(
+        self, fileobj: BinaryIO, bucket: str, content_type: str = "image/png"
+    ) -> S3StorageObject:
+        """
+        Upload an in-memory file to an S3 bucket.
+
+        Parameters
+        ----------
+        fileobj : BinaryIO
+            readable binary buffer, positioned at the start
+        bucket : str
+            bucket name
+        content_type : str, optional
+            content type of the object, by default "image/png"
+
+        Returns
+        -------
+        S3StorageObject
+            s3 object
+        """
+        object_name = uuid.uuid4().hex
+        self.s3.upload_fileobj(
+            fileobj,
+            bucket,
+            object_name,
+            ExtraArgs={"ContentType": content_type},
+            Config=self.transfer_config,
+        )
+
+        return S3StorageObject(object_name=object_name, bucket=bucket)
+
+    def upload_fileobjs(
+        self,
+        fileobjs: list[BinaryIO],
+        bucket: str,
+        content_type: str = "image/png",
+    ) -> list[S3StorageObject]:
+        """
+        Upload several in-memory files to an S3 bucket concurrently.
+
+        Up to S3_UPLOAD_CONCURRENCY uploads run at once over the shared client,
+        so a whole carousel costs about one upload of wall time.
+
+        Parameters
+        ----------
+        fileobjs : list[BinaryIO]
+            readable binary buffers, positioned at the start
+        bucket : str
+            bucket name
+        content_type : str, optional
+            content type of every object, by default "image/png"
+
+        Returns
+        -------
+        list[S3StorageObject]
+            s3 objects, in the order of `fileobjs`
+
+        Raises
+        ------
+        Exception
+            The first upload error, once every upload has finished.
+        """
+        if len(fileobjs) <= 1:
+            return [
+                self.upload_fileobj(fileobj, bucket, content_type)
+                for fileobj in fileobjs
+            ]
+
+        max_workers = min(self.upload_concurrency, len(fileobjs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.upload_fileobj, fileobj, bucket, content_type)
+                for fileobj in fileobjs
+            ]
+        return [future.result() for future in futures]
+
     def delete_file(self, param: DeleteImageRequest):
         """
         Delete a file from an S3 bucket.
@@ -59,3 +189,45 @@ class AWSService:
             object name
         """
         self.s3.delete_object(Bucket=param.bucket, Key=param.object_name)
+
+    def delete_files(self, bucket: str, object_names: list[str]) -> list[str]:
+        """
+        Delete files from an S3 bucket with batched DeleteObjects requests.
+
+        Parameters
+        ----------
+        bucket : str
+            bucket name
+        object_names : list[str]
+            object names; sent in batches of DELETE_OBJECTS_MAX_KEYS
+
+        Returns
+        -------
+        list[str]
+            object names that S3 failed to delete
+        """
+        failed = []
+        for start in range(0, len(object_names), DELETE_OBJECTS_MAX_KEYS):
+            batch = object_names[start : start + DELETE_OBJECTS_MAX_KEYS]
+            response = self.s3.delete_objects(
+                Bucket=bucket,
+                Delete={
+                    "Objects": [{"Key": object_name} for object_name in batch],
+                    "Quiet": True,
+                },
+            )
+            failed.extend(error["Key"] for error in response.get("Errors", []))
+        return failed
+
+    def stats(self) -> dict:
+        """
+        S3 client construction metrics of this process.
+
+        Returns
+        -------
+        dict
+            init time of this service's client, and the number and total init
+            time of every client built in the process
+        """
+        with _client_metrics_lock:
+            return {"client_init_ms": self.client_init_ms, **_client_metrics}
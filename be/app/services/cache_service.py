@@ -0,0 +1,348 @@
+"""
+Process-wide caches that survive restarts.
+
+`PersistentTTLCache` keeps entries in an in-memory LRU map and writes them
+through to a local sqlite file. Expired entries are dropped on read.
+`ContentAddressedFileCache` keeps large blobs as files, bounded by total bytes.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class PersistentTTLCache:
+    """
+    A thread-safe LRU cache with per-entry TTL, backed by a sqlite file.
+
+    Parameters
+    ----------
+    name : str
+        name of the cache, used as the sqlite table name and in logs
+    ttl_seconds : float
+        how long an entry stays valid
+    max_entries : int
+        maximum number of entries kept in memory and on disk
+    db_path : str | None, optional
+        path to the sqlite file, by default None (memory only)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int,
+        db_path: str | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = int(max_entries)
+        self.db_path = db_path
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = None
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.name} "
+                    "(key TEXT PRIMARY KEY, expires_at REAL, value BLOB)"
+                )
+                self._db.commit()
+                self._load_from_disk()
+            except sqlite3.Error as e:
+                logger.error(f"Cache {self.name}: disk store unavailable: {e}")
+                self._db = None
+
+    def _load_from_disk(self) -> None:
+        assert self._db is not None
+        now = time.time()
+        self._db.execute(f"DELETE FROM {self.name} WHERE expires_at <= ?", (now,))
+        self._db.commit()
+        rows = self._db.execute(
+            f"SELECT key, expires_at, value FROM {self.name} "
+            "ORDER BY expires_at DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        # oldest first so that the most recently written entries end up most recent
+        for key, expires_at, value in reversed(rows):
+            try:
+                self._entries[key] = (expires_at, pickle.loads(value))
+            except Exception:
+                continue
+        logger.info(f"Cache {self.name}: loaded {len(self._entries)} entries from disk")
+
+    def _delete_from_disk(self, key: str) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(f"DELETE FROM {self.name} WHERE key = ?", (key,))
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Cache {self.name}: failed to delete {key}: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        default : Any, optional
+            returned on a miss, by default None
+
+        Returns
+        -------
+        Any
+            the cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self._delete_from_disk(key)
+            self.misses += 1
+            return default
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """
+        Put a value into the cache, evicting the least recently used entries.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        value : Any
+            picklable value
+        ttl_seconds : float | None, optional
+            overrides the cache TTL for this entry, by default None
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                self._delete_from_disk(evicted_key)
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        f"INSERT OR REPLACE INTO {self.name} (key, expires_at, value) "
+                        "VALUES (?, ?, ?)",
+                        (key, expires_at, pickle.dumps(value)),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Cache {self.name}: failed to persist {key}: {e}")
+
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key : str
+            cache key
+        factory : Callable[[], Any]
+            computes the value on a miss
+
+        Returns
+        -------
+        Any
+            the cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute(f"DELETE FROM {self.name}")
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Hit/miss counters for the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            name, size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+class ContentAddressedFileCache:
+    """
+    A thread-safe LRU cache of binary blobs stored as files named by their key.
+
+    Unlike `PersistentTTLCache`, the size limit is the total number of bytes on
+    disk, which suits large values such as images. Recency survives restarts
+    through the files' modification times.
+
+    Parameters
+    ----------
+    name : str
+        name of the cache, used in logs and stats
+    directory : str
+        directory holding one file per entry
+    max_bytes : int
+        maximum total size of the entries
+    """
+
+    def __init__(self, name: str, directory: str, max_bytes: int) -> None:
+        self.name = name
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        os.makedirs(directory, exist_ok=True)
+        files = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        # least recently used first
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+        logger.info(
+            f"Cache {self.name}: loaded {len(self._entries)} entries "
+            f"({self._total_bytes} bytes) from disk"
+        )
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get a blob from the cache.
+
+        Parameters
+        ----------
+        key : str
+            cache key, usable as a file name (e.g. a hex digest)
+
+        Returns
+        -------
+        bytes | None
+            the cached blob, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                    os.utime(self._path(key))
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return data
+                except OSError:
+                    self._total_bytes -= self._entries.pop(key)
+            self.misses += 1
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """
+        Put a blob into the cache, evicting the least recently used entries.
+
+        Parameters
+        ----------
+        key : str
+            cache key, usable as a file name (e.g. a hex digest)
+        data : bytes
+            the blob
+        """
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            tmp_path = self._path(f"{key}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                logger.error(f"Cache {self.name}: failed to persist {key}: {e}")
+                return
+            self._total_bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Hit/miss counters for the cache.
+
+        Returns
+        -------
+        dict[str, Any]
+            name, size, bytes, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
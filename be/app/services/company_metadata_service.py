@@ -0,0 +1,51 @@
+import os
+
+import yfinance as yf
+
+from app.logging_config import get_logger
+from app.services.cache_service import PersistentTTLCache
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+UNKNOWN_STOCK_NAME = "Unknown Stock"
+
+
+class CompanyMetadataService:
+    """
+    Resolves company metadata from yfinance, cached per ticker.
+    """
+
+    def __init__(self) -> None:
+        self.settings = Settings().get_settings()
+        self.cache = PersistentTTLCache(
+            name="company_metadata",
+            ttl_seconds=int(self.settings.COMPANY_METADATA_TTL_SECONDS),
+            max_entries=int(self.settings.COMPANY_METADATA_CACHE_MAX_ENTRIES),
+            db_path=os.path.join(self.settings.CACHE_DIR, "stockly_cache.sqlite3"),
+        )
+
+    def get_long_name(self, ticker: str) -> str:
+        """
+        Get the long name of the company behind the ticker.
+
+        Parameters
+        ----------
+        ticker : str
+            stock ticker
+
+        Returns
+        -------
+        str
+            long name, or "Unknown Stock" if yfinance does not know it
+        """
+        key = ticker.upper()
+        long_name = self.cache.get(key)
+        if long_name is None:
+            logger.info(f"Company metadata cache miss for {key}, querying yfinance")
+            long_name = yf.Ticker(ticker).info.get("longName", UNKNOWN_STOCK_NAME)
+            self.cache.set(key, long_name)
+        return long_name
+
+    def stats(self) -> dict:
+        return self.cache.stats()
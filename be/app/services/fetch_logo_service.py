@@ -1,21 +1,39 @@
 """
 Fetch the top image from Google images for the given company logo.
 
-
+Results are kept in a persistent cache (logo URL and bytes per company), with
+a shorter TTL for companies Google returned no usable image for, so steady-state
+posts do not touch Google Images. On a miss the result page is streamed and
+parsing stops at the second `<img>` tag.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 from app.logging_config import get_logger
 from app.errors.base_error import StocklyError
+from app.errors.logo_not_found_error import LogoNotFoundError
+from app.services.cache_service import PersistentTTLCache
+from app.services.http_client_service import HttpClientService
+from app.services.logo_html_extractor import extract_image_sources
+from app.settings import Settings
 
 
 logger = get_logger(__name__)
 
 
 class FetchLogoService:
-    @staticmethod
-    def fetch_company_logo(company_name: str) -> str:
+    def __init__(
+        self,
+        http_client: HttpClientService,
+        logo_cache: PersistentTTLCache | None = None,
+    ):
+        self.http_client = http_client
+        self.logo_cache = logo_cache
+        self.settings = Settings().get_settings()
+
+    def fetch_company_logo(self, company_name: str) -> str:
         """Fetch the top image URL from Google Images for the given company name.
 
         Args:
@@ -24,37 +42,137 @@ class FetchLogoService:
             str: The URL of the top image result.
 
         """
+        return self._entry(company_name)["url"]
+
+    def fetch_company_logo_bytes(self, company_name: str) -> bytes:
+        """Fetch the encoded logo image for the given company name.
+
+        Args:
+            company_name (str): The name of the company to search for.
+        Returns:
+            bytes: The logo image, from the cache when possible.
+
+        """
+        entry = self._entry(company_name)
+        if entry.get("data"):
+            return entry["data"]
+
+        data = self._download_logo(entry["url"])
+        if self.logo_cache is not None:
+            self.logo_cache.set(
+                self._cache_key(company_name), {"url": entry["url"], "data": data}
+            )
+        return data
+
+    def warm_up(self, company_names: list[str]) -> dict[str, int]:
+        """Fill the logo cache for every company that is not cached yet.
+
+        Args:
+            company_names (list[str]): Companies to fetch, e.g. "NASDAQ:AAPL".
+        Returns:
+            dict[str, int]: Number of companies already cached, fetched and failed.
+
+        """
+        pending = [
+            name
+            for name in dict.fromkeys(company_names)
+            if self._cached_entry(name) is None
+        ]
+        counts = {
+            "cached": len(set(company_names)) - len(pending),
+            "fetched": 0,
+            "failed": 0,
+        }
+
+        def fetch(company_name: str) -> bool:
+            try:
+                self.fetch_company_logo_bytes(company_name)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to warm logo of {company_name}: {e}")
+                return False
+
+        max_workers = max(1, int(self.settings.LOGO_WARMUP_CONCURRENCY))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for ok in executor.map(fetch, pending):
+                counts["fetched" if ok else "failed"] += 1
+
+        logger.info(f"Logo cache warm-up: {counts}")
+        return counts
+
+    def _cache_key(self, company_name: str) -> str:
+        return company_name.upper()
+
+    def _cached_entry(self, company_name: str) -> dict | None:
+        if self.logo_cache is None:
+            return None
+        return self.logo_cache.get(self._cache_key(company_name))
+
+    def _entry(self, company_name: str) -> dict:
+        entry = self._cached_entry(company_name)
+        if entry is None:
+            entry = self._fetch_entry(company_name)
+        if entry["url"] is None:
+            raise LogoNotFoundError(entry["error"])
+        return entry
+
+    def _fetch_entry(self, company_name: str) -> dict:
+        try:
+            entry = {"url": self._scrape_logo_url(company_name), "data": None}
+            ttl_seconds = None
+        except LogoNotFoundError as e:
+            # "no image" answers are cached briefly, network errors not at all
+            entry = {"url": None, "error": e.error_message}
+            ttl_seconds = int(self.settings.LOGO_NEGATIVE_CACHE_TTL_SECONDS)
+
+        if self.logo_cache is not None:
+            self.logo_cache.set(
+                self._cache_key(company_name), entry, ttl_seconds=ttl_seconds
+            )
+        return entry
+
+    def _download_logo(self, url: str) -> bytes:
+        try:
+            # Google Images often inlines thumbnails as data URIs
+            if url.startswith("data:"):
+                return base64.b64decode(url.split(",", 1)[1])
+            response = self.http_client.get(url)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            logger.error(f"Failed to download logo {url[:80]}: {e}")
+            raise StocklyError(
+                {"fetch_logo": ["Failed to download the company logo."]},
+                error_code=500,
+            )
+
+    def _scrape_logo_url(self, company_name: str) -> str:
         try:
             search_url = f"https://www.google.com/search?tbm=isch&q={company_name}+logo"
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
             }
-            response = requests.get(search_url, headers=headers)
-            response.raise_for_status()
+            with self.http_client.stream(search_url, headers=headers) as response:
+                response.raise_for_status()
+                # The first image is usually the Google logo, so we take the second one
+                sources = extract_image_sources(
+                    response.iter_text(),
+                    limit=2,
+                    max_chars=int(self.settings.LOGO_PAGE_MAX_CHARS),
+                )
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            img_tags = soup.find_all("img")
-
-            if len(img_tags) > 1:
-                if img_tags[1].get("src") is None:
-                    raise StocklyError(
-                        {
-                            "fetch_logo": [
-                                f"No valid image source found for company: {company_name}"
-                            ]
-                        },
-                        error_code=500,
+            if len(sources) > 1:
+                if sources[1] is None:
+                    raise LogoNotFoundError(
+                        f"No valid image source found for company: {company_name}"
                     )
-                # The first image is usually the Google logo, so we take the second one
-                logo_url = img_tags[1]["src"]
-                return logo_url
+                return sources[1]
             else:
-                raise StocklyError(
-                    {"fetch_logo": [f"No images found for company: {company_name}"]},
-                    error_code=500,
-                )
+                raise LogoNotFoundError(f"No images found for company: {company_name}")
 
-        except requests.RequestException as e:
+        except StocklyError:
+            raise
+        except httpx.HTTPError as e:
             logger.error(f"Request failed: {e}")
             raise StocklyError(
                 {
@@ -0,0 +1,122 @@
+import os
+import threading
+
+from PIL import ImageFont
+
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Debian/Ubuntu
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+    "/Library/Fonts/Arial.ttf",  # macOS (if installed)
+    "/System/Library/Fonts/Supplemental/Arial.ttf",  # macOS
+    "C:/Windows/Fonts/arial.ttf",  # Windows
+    "arial.ttf",
+]
+
+BOLD_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSerif-Bold.ttf",  # Debian/Ubuntu
+    "/usr/share/fonts/truetype/liberation/LiberationSerif-Bold.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSerifBold.ttf",
+    "/Library/Fonts/Arial Bold.ttf",  # macOS (if installed)
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
+    "C:/Windows/Fonts/arialbd.ttf",  # Windows
+    "arialbd.ttf",
+]
+
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+
+def find_font_path(env_var: str, candidates: list[str]) -> str | None:
+    """Best-effort locate a TrueType font on this system.
+
+    Checks the env override first, then common Linux/Mac/Windows locations.
+    Returns a path or None if nothing suitable is found.
+    """
+    for path in [os.environ.get(env_var), *candidates]:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+class FontService:
+    """
+    Resolves the overlay fonts once and keeps loaded fonts keyed by (path, size).
+
+    Meant to be used as a process-wide singleton, so every request and thread
+    shares the already parsed font files.
+    """
+
+    def __init__(self) -> None:
+        self.font_path = find_font_path("FONT_PATH", FONT_CANDIDATES)
+        self.bold_font_path = find_font_path("BOLD_FONT_PATH", BOLD_FONT_CANDIDATES)
+        logger.info(
+            f"Resolved fonts: regular={self.font_path}, bold={self.bold_font_path}"
+        )
+
+        self._lock = threading.Lock()
+        self._fonts: dict[tuple[str | None, int], Font | None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size: int) -> Font:
+        """
+        Get the regular overlay font, falling back to Pillow's default font.
+
+        Parameters
+        ----------
+        size : int
+            font size
+
+        Returns
+        -------
+        Font
+            the loaded font
+        """
+        return self._load(self.font_path, size) or ImageFont.load_default()
+
+    def get_bold_font(self, size: int) -> Font:
+        """
+        Get the bold overlay font, falling back to the regular font.
+
+        Parameters
+        ----------
+        size : int
+            font size
+
+        Returns
+        -------
+        Font
+            the loaded font
+        """
+        return self._load(self.bold_font_path, size) or self.get_font(size)
+
+    def _load(self, path: str | None, size: int) -> Font | None:
+        if path is None:
+            return None
+        key = (path, size)
+        with self._lock:
+            if key in self._fonts:
+                self.hits += 1
+                return self._fonts[key]
+            self.misses += 1
+            try:
+                font = ImageFont.truetype(path, size)
+            except OSError:
+                logger.error(f"Could not load font {path}")
+                font = None
+            self._fonts[key] = font
+            return font
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "font_path": self.font_path,
+                "bold_font_path": self.bold_font_path,
+                "loaded": len(self._fonts),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,164 @@
+"""
+Shared, pooled HTTP client for every outbound call made by the services.
+
+A single `httpx.Client` keeps per-host keep-alive connection pools, so
+repeated calls to the same host (Instagram Graph API, S3, Google) reuse
+TCP/TLS connections instead of paying a fresh handshake each time. HTTP/2 is
+enabled when the optional `h2` package is installed.
+"""
+
+import importlib.util
+import threading
+from collections import defaultdict
+from contextlib import AbstractContextManager
+from functools import partial
+from typing import Any
+
+import httpx
+
+from app.logging_config import get_logger
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+
+class HttpClientService:
+    """
+    Thin wrapper over a pooled `httpx.Client` that also records pool statistics.
+    """
+
+    def __init__(self) -> None:
+        self.settings = Settings().get_settings()
+        self.http2 = importlib.util.find_spec("h2") is not None
+
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"requests": 0, "new_connections": 0, "tls_handshakes": 0}
+        )
+
+        self.client = httpx.Client(
+            http2=self.http2,
+            follow_redirects=True,
+            timeout=float(self.settings.HTTP_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=int(self.settings.HTTP_MAX_CONNECTIONS),
+                max_keepalive_connections=int(
+                    self.settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                keepalive_expiry=float(self.settings.HTTP_KEEPALIVE_EXPIRY_SECONDS),
+            ),
+            event_hooks={"request": [self._on_request]},
+        )
+        logger.info(f"Shared HTTP client created (http2={self.http2})")
+
+    def _on_request(self, request: httpx.Request) -> None:
+        host = request.url.host
+        with self._lock:
+            self._stats[host]["requests"] += 1
+        request.extensions["trace"] = partial(self._on_trace, host)
+
+    def _on_trace(self, host: str, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            key = "new_connections"
+        elif event_name == "connection.start_tls.complete":
+            key = "tls_handshakes"
+        else:
+            return
+        with self._lock:
+            self._stats[host][key] += 1
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a GET request through the shared pool.
+
+        Parameters
+        ----------
+        url : str
+            the url to request
+        **kwargs
+            forwarded to `httpx.Client.get` (params, headers, ...)
+
+        Returns
+        -------
+        httpx.Response
+            the response
+        """
+        return self.client.get(url, **kwargs)
+
+    def stream(self, url: str, **kwargs) -> AbstractContextManager[httpx.Response]:
+        """
+        Send a GET request through the shared pool without reading the body.
+
+        Use as a context manager and read the body with `iter_text` /
+        `iter_bytes`. The response is closed on exit. Only a connection whose
+        body was read to the end goes back to the pool; exiting early closes
+        an HTTP/1.1 connection (an HTTP/2 stream is reset instead), trading a
+        new handshake on the next request for not downloading the rest.
+
+        Parameters
+        ----------
+        url : str
+            the url to request
+        **kwargs
+            forwarded to `httpx.Client.stream` (params, headers, ...)
+
+        Returns
+        -------
+        AbstractContextManager[httpx.Response]
+            the streamed response
+        """
+        return self.client.stream("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a POST request through the shared pool.
+
+        Parameters
+        ----------
+        url : str
+            the url to request
+        **kwargs
+            forwarded to `httpx.Client.post` (params, headers, json, ...)
+
+        Returns
+        -------
+        httpx.Response
+            the response
+        """
+        return self.client.post(url, **kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Per-host pool statistics.
+
+        `reused_connections` is the number of requests that did not need a new
+        TCP connection, i.e. the handshakes saved by pooling.
+
+        Returns
+        -------
+        dict[str, Any]
+            http2 flag, per-host counters and totals
+        """
+        with self._lock:
+            hosts = {
+                host: {
+                    **counters,
+                    "reused_connections": max(
+                        0, counters["requests"] - counters["new_connections"]
+                    ),
+                }
+                for host, counters in self._stats.items()
+            }
+        totals = {
+            key: sum(host[key] for host in hosts.values())
+            for key in (
+                "requests",
+                "new_connections",
+                "tls_handshakes",
+                "reused_connections",
+            )
+        }
+        return {"http2": self.http2, "hosts": hosts, "totals": totals}
+
+    def close(self) -> None:
+        self.client.close()
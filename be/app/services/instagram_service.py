@@ -1,5 +1,4 @@
 from httpx import head
-import requests
 import time
 
 from app.errors.external_api_error import ExternalServiceError
@@ -7,6 +6,7 @@ from app.models.request.instagram_service_request import (
     InstagramCarouselRequest,
     InstagramImageRequest,
 )
+from app.services.http_client_service import HttpClientService
 from app.settings import Settings
 from app.logging_config import get_logger
 from app.models.response.instagram_service_response import (
@@ -24,9 +24,13 @@ class InstagramService:
     access_token: str
 
     def __init__(
-        self, user_id: str | None = None, access_token: str | None = None
+        self,
+        http_client: HttpClientService,
+        user_id: str | None = None,
+        access_token: str | None = None,
     ) -> None:
         self.settings = Settings().get_settings()
+        self.http_client = http_client
         self.user_id = user_id or self.settings.INSTA_USER_ID
         self.access_token = access_token or self.settings.INSTA_ACCESS_TOKEN
 
@@ -42,7 +46,7 @@ class InstagramService:
     def _create_instagram_image_container(
         self, req: InstagramImageRequest
     ) -> InstagramServiceContainer:
-        response = requests.post(
+        response = self.http_client.post(
             url=f"https://graph.instagram.com/v21.0/{self.user_id}/media",
             headers={"Content-Type": "application/json"},
             params={
@@ -51,7 +55,7 @@ class InstagramService:
                 "caption": req.caption,
             },
         )
-        if response:
+        if response.is_success:
             return InstagramServiceContainer.model_validate(response.json())
         else:
             raise ExternalServiceError("Failed to create image container")
@@ -68,7 +72,7 @@ class InstagramService:
             logger.info("Waiting for carousel container to be ready...")
             time.sleep(2)
 
-        response = requests.post(
+        response = self.http_client.post(
             url=f"https://graph.instagram.com/v21.0/{self.user_id}/media_publish",
             headers={
                 "Content-Type": "application/json",
@@ -78,7 +82,7 @@ class InstagramService:
                 "creation_id": container.id,
             },
         )
-        if response:
+        if response.is_success:
             return InstagramServiceContainer.model_validate(response.json())
         else:
             raise ExternalServiceError(
@@ -166,7 +170,7 @@ class InstagramService:
                     logger.info(
                         f"Attempt {attempt} to create carousel with containers: {containers}\n{caption}"
                     )
-                    response = requests.post(
+                    response = self.http_client.post(
                         url=f"https://graph.instagram.com/v21.0/{self.user_id}/media",
                         headers={
                             "Content-Type": "application/json",
@@ -181,7 +185,7 @@ class InstagramService:
                         },
                     )
 
-                    if response:
+                    if response.is_success:
                         carousel_container = InstagramServiceContainer.model_validate(
                             response.json()
                         )
@@ -224,7 +228,7 @@ class InstagramService:
         dict
             The response from Instagram API.
         """
-        response = requests.post(
+        response = self.http_client.post(
             url=f"https://graph.instagram.com/v21.0/{self.user_id}/media",
             headers={"Content-Type": "application/json"},
             params={
@@ -234,7 +238,7 @@ class InstagramService:
                 "caption": caption,
             },
         )
-        if response:
+        if response.is_success:
             return InstagramServiceContainer.model_validate(response.json())
         else:
             raise ExternalServiceError("Failed to create carousel container")
@@ -255,7 +259,7 @@ class InstagramService:
         InstagramContainerStatus
             The status of the container.
         """
-        response = requests.get(
+        response = self.http_client.get(
             url=f"https://graph.instagram.com/v21.0/{container.id}",
             headers={
                 "Content-Type": "application/json",
@@ -265,7 +269,7 @@ class InstagramService:
                 "fields": "status_code,id,status",
             },
         )
-        if response:
+        if response.is_success:
             data = response.json()
             return InstagramContainerStatus.model_validate(data)
         else:
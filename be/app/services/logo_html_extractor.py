@@ -0,0 +1,83 @@
+"""
+Early-exit extraction of the first image sources of a Google Images page.
+
+This returns the same `src` values as `BeautifulSoup(html, "html.parser")
+.find_all("img")[:limit]`, but the page is fed through `html.parser` chunk by
+chunk and parsing stops at the `limit`-th `<img>` tag, so no tree is built and
+the rest of the page is never read.
+"""
+
+from html.parser import HTMLParser
+from typing import Iterable
+
+
+class _EnoughImages(Exception):
+    pass
+
+
+class ImageSourceExtractor(HTMLParser):
+    """
+    Streaming parser collecting the `src` of the first `limit` img tags.
+
+    A tag without a `src` attribute is recorded as None. Like BeautifulSoup, a
+    valueless `src` reads as "" and the last of duplicated attributes wins.
+    """
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.sources: list[str | None] = []
+
+    @property
+    def done(self) -> bool:
+        return len(self.sources) >= self.limit
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag != "img":
+            return
+        src = None
+        for name, value in attrs:
+            if name == "src":
+                src = value or ""
+        self.sources.append(src)
+        if self.done:
+            raise _EnoughImages
+
+    def feed(self, data: str) -> None:
+        if self.done:
+            return
+        try:
+            super().feed(data)
+        except _EnoughImages:
+            pass
+
+
+def extract_image_sources(
+    chunks: Iterable[str], limit: int, max_chars: int = 0
+) -> list[str | None]:
+    """
+    Extract the `src` of the first `limit` img tags, reading as little as possible.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        The page, e.g. `httpx.Response.iter_text()`; iteration stops as soon as
+        enough images were found.
+    limit : int
+        Number of img tags to collect.
+    max_chars : int, optional
+        Stop reading after this many characters, by default 0 (no bound).
+
+    Returns
+    -------
+    list[str | None]
+        Up to `limit` sources in document order, None for an img without src.
+    """
+    extractor = ImageSourceExtractor(limit)
+    read = 0
+    for chunk in chunks:
+        extractor.feed(chunk)
+        read += len(chunk)
+        if extractor.done or (max_chars and read >= max_chars):
+            break
+    return extractor.sources
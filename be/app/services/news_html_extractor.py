@@ -0,0 +1,204 @@
+"""
+Single-pass extraction of the first descendant div texts of a news page.
+
+This produces the same texts as `ParserService._extract_headlines_soup`
+(`div.find("div").text.strip()` for every div that contains a div) without
+building a BeautifulSoup tree: the page is fed once through `html.parser`
+and only a stack of open elements is kept.
+"""
+
+from html.parser import HTMLParser
+
+# Text inside these tags is not part of `Tag.text` in BeautifulSoup (it is
+# stored as Script/Stylesheet/TemplateString/Ruby*String), even in nested tags
+SKIPPED_TAGS = {"script", "style", "template", "rt", "rp"}
+
+# Whitespace-only text inside these tags is kept as-is
+PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+
+ASCII_SPACES = " \n\t\x0c\r"
+
+# Tags that never stay open (same list BeautifulSoup uses)
+VOID_TAGS = {
+    "area",
+    "base",
+    "basefont",
+    "bgsound",
+    "br",
+    "col",
+    "command",
+    "embed",
+    "frame",
+    "hr",
+    "image",
+    "img",
+    "input",
+    "isindex",
+    "keygen",
+    "link",
+    "menuitem",
+    "meta",
+    "nextid",
+    "param",
+    "source",
+    "spacer",
+    "track",
+    "wbr",
+}
+
+
+class _OpenDiv:
+    __slots__ = ("has_first_div", "text_start", "text_slot")
+
+    def __init__(self, text_start: int | None = None, text_slot: int = -1) -> None:
+        # whether the first descendant div of this div has been seen
+        self.has_first_div = False
+        # index into the text chunks where this div's text starts, if it is
+        # the first descendant div of one of its ancestors
+        self.text_start = text_start
+        # index of this div's text in the results
+        self.text_slot = text_slot
+
+
+class FirstChildDivExtractor(HTMLParser):
+    """
+    Streaming parser collecting the text of every div that is the first
+    descendant div of another div, in document order.
+
+    Open elements are tracked the way BeautifulSoup's html.parser builder does
+    it: an end tag closes everything up to the most recent open element of the
+    same name, and is ignored if there is none. Whitespace-only text runs are
+    collapsed to a single space or newline, as BeautifulSoup does.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._open_tags: list[tuple[str, _OpenDiv | None]] = []
+        self._open_counts: dict[str, int] = {}
+        self._open_divs: list[_OpenDiv] = []
+        self._captured_open = 0
+        self._skip_depth = 0
+        self._chunks: list[str] = []
+        self._texts: list[str] = []
+        self._pending_data: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush_data()
+        if tag in VOID_TAGS:
+            return
+
+        open_div = None
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "div":
+            open_div = self._open_div()
+
+        self._open_tags.append((tag, open_div))
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+
+    def _open_div(self) -> _OpenDiv:
+        captured = False
+        # every open ancestor without a first div so far gets this one; those
+        # ancestors are always the innermost ones, so walk from the top
+        for ancestor in reversed(self._open_divs):
+            if ancestor.has_first_div:
+                break
+            ancestor.has_first_div = True
+            captured = True
+
+        if captured:
+            # the text slot is reserved now so results stay in document order
+            self._texts.append("")
+            open_div = _OpenDiv(len(self._chunks), len(self._texts) - 1)
+            self._captured_open += 1
+        else:
+            open_div = _OpenDiv()
+        self._open_divs.append(open_div)
+        return open_div
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        if tag in VOID_TAGS:
+            self._flush_data()
+            return
+        self.handle_starttag(tag, attrs)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_data()
+        if not self._open_counts.get(tag):
+            return
+        while self._open_tags:
+            name = self._pop()
+            if name == tag:
+                break
+
+    def _pop(self) -> str:
+        name, open_div = self._open_tags.pop()
+        self._open_counts[name] -= 1
+        if name in SKIPPED_TAGS:
+            self._skip_depth -= 1
+        elif open_div is not None:
+            self._open_divs.pop()
+            if open_div.text_start is not None:
+                self._texts[open_div.text_slot] = "".join(
+                    self._chunks[open_div.text_start :]
+                ).strip()
+                self._captured_open -= 1
+                if not self._captured_open:
+                    self._chunks.clear()
+        return name
+
+    def handle_data(self, data: str) -> None:
+        if self._captured_open and not self._skip_depth:
+            self._pending_data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_data()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush_data()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush_data()
+
+    def _flush_data(self) -> None:
+        if not self._pending_data:
+            return
+        data = "".join(self._pending_data)
+        self._pending_data.clear()
+        if not data.strip(ASCII_SPACES) and not any(
+            self._open_counts.get(tag) for tag in PRESERVE_WHITESPACE_TAGS
+        ):
+            data = "\n" if "\n" in data else " "
+        self._chunks.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_data()
+        # unclosed elements end at the end of the document
+        while self._open_tags:
+            self._pop()
+
+    @property
+    def texts(self) -> list[str]:
+        return self._texts
+
+
+def extract_first_child_div_texts(html: str) -> list[str]:
+    """
+    Extract the unique first descendant div texts of every div, in document order.
+
+    Parameters
+    ----------
+    html : str
+        The raw HTML.
+
+    Returns
+    -------
+    list[str]
+        The unique, stripped texts.
+    """
+    extractor = FirstChildDivExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return list(dict.fromkeys(extractor.texts))
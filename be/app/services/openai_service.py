@@ -1,28 +1,51 @@
+import hashlib
+import re
 import time
+from typing import Iterator
+
+import httpx
 from openai import OpenAI
 from openai.types import ImagesResponse
 from openai.types.responses import Response, ResponseOutputMessage
 from openai.types.responses.response_output_text import ResponseOutputText
 from openai.types.responses.response_output_refusal import ResponseOutputRefusal
 
+from app.errors.base_error import StocklyError
 from app.logging_config import get_logger
 from app.models.request.generate_image_request import (
     GenerateImageRequest,
 )
+from app.services.cache_service import PersistentTTLCache
+from app.services.http_client_service import HttpClientService
 from app.settings import Settings
 
 logger = get_logger(__name__)
 
+WRITTEN_PROMPT_MODEL = "gpt-4o-mini"
+IMAGE_PROMPT_MODEL = "dall-e-3"
+
+BATCH_SECTION_PATTERN = re.compile(r"^\s*=== STOCK: (.+?) ===\s*$", re.MULTILINE)
+
 
 class OpenAIService:
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: HttpClientService,
+        analysis_cache: PersistentTTLCache | None = None,
+    ):
         self.settings = Settings().get_settings()
+        self.analysis_cache = analysis_cache
 
         self.client = OpenAI(
             organization="org-DZHAxp8YdIcZZTJ305iG7cKb",
             project="proj_llL0cbSB0T4XXDSSGOvUCbdT",
             api_key=self.settings.OPENAI_API_KEY,
             max_retries=3,
+            # shares the pool, but long completions keep the SDK's 600 s timeout
+            timeout=httpx.Timeout(
+                float(self.settings.OPENAI_TIMEOUT_SECONDS), connect=5.0
+            ),
+            http_client=http_client.client,
         )
 
     def generate_written_prompt(
@@ -30,25 +53,273 @@ class OpenAIService:
     ) -> str:
         """
         Generate a written prompt for the stock based on the formatted HTML.
-        """
-        PROMPT = f"""
-        I have scraped several Google News articles related to the stock {stock_ticker}. Please provide the following:
 
-        1. A concise summary of the 3 main key points from these news articles. Prefix this with a '###' header, named "Summary:".
-        2. An analysis of the sentiment (ecstatic, positive, neutral, negative, disastrous) of the articles based on how they affect the stock's outlook. Prefix this with a '###' header, named "Sentiment Analysis: <Your evaluation>".
-        {formatted_html}
+        Results are cached by ticker, model and a hash of the formatted HTML, so
+        unchanged news for the same ticker does not hit OpenAI again.
         """
+        cache_key = self._analysis_cache_key(stock_ticker, formatted_html)
+        if self.analysis_cache is not None and retry_count == 0:
+            cached = self.analysis_cache.get(cache_key)
+            if cached:
+                logger.info(f"Analysis cache hit for {stock_ticker}")
+                return cached
+
+        PROMPT = self._written_prompt(stock_ticker, formatted_html)
 
         self.settings = Settings().get_settings()
 
         response: Response = self.client.responses.create(
-            model="gpt-4o-mini",
+            model=WRITTEN_PROMPT_MODEL,
             input=[{"role": "user", "content": PROMPT}],
             temperature=0.7,
         )
 
         logger.info(f"Generated written prompt for {stock_ticker}: {response}")
 
+        text = self._extract_output_text(response)
+        if text is not None:
+            if self.analysis_cache is not None and text:
+                self.analysis_cache.set(cache_key, text)
+            return text
+
+        if retry_count < 3:
+            time.sleep(2**retry_count)
+            return self.generate_written_prompt(
+                stock_ticker, formatted_html, retry_count=retry_count + 1
+            )
+
+        return ""
+
+    def stream_written_prompt(
+        self, stock_ticker: str, formatted_html: str
+    ) -> Iterator[str]:
+        """
+        Stream a written prompt for the stock as text deltas arrive from OpenAI.
+
+        A cached analysis is yielded in one piece. The full streamed text is
+        cached on completion, like `generate_written_prompt`.
+
+        Parameters
+        ----------
+        stock_ticker : str
+            the stock ticker
+        formatted_html : str
+            the formatted news text
+
+        Yields
+        ------
+        str
+            text deltas of the analysis
+
+        Raises
+        ------
+        StocklyError
+            If the response failed, was cut short, or produced no text.
+        """
+        cache_key = self._analysis_cache_key(stock_ticker, formatted_html)
+        if self.analysis_cache is not None:
+            cached = self.analysis_cache.get(cache_key)
+            if cached:
+                logger.info(f"Analysis cache hit for {stock_ticker}")
+                yield cached
+                return
+
+        stream = self.client.responses.create(
+            model=WRITTEN_PROMPT_MODEL,
+            input=[
+                {
+                    "role": "user",
+                    "content": self._written_prompt(stock_ticker, formatted_html),
+                }
+            ],
+            temperature=0.7,
+            stream=True,
+        )
+
+        parts: list[str] = []
+        refusal: list[str] = []
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                parts.append(event.delta)
+                yield event.delta
+            elif event.type == "response.refusal.delta":
+                refusal.append(event.delta)
+            elif event.type == "error":
+                logger.error(f"OpenAI stream error: {event.code} {event.message}")
+                raise StocklyError(
+                    {"openai": ["OpenAI failed to generate the analysis."]},
+                    error_code=500,
+                )
+            elif event.type in ("response.failed", "response.incomplete"):
+                # partial text is dropped, not cached
+                logger.error(
+                    f"OpenAI stream for {stock_ticker} ended with {event.type}: "
+                    f"{event.response.error or event.response.incomplete_details}"
+                )
+                raise StocklyError(
+                    {"openai": ["OpenAI failed to generate the analysis."]},
+                    error_code=500,
+                )
+
+        text = "".join(parts)
+        if refusal:
+            logger.error(
+                f"OpenAI refused to generate written prompt: {''.join(refusal)}"
+            )
+            if not text:
+                raise StocklyError(
+                    {"openai": ["OpenAI refused to generate the analysis."]},
+                    error_code=500,
+                )
+        elif not text:
+            logger.error(f"OpenAI streamed no text for {stock_ticker}")
+            raise StocklyError(
+                {"openai": ["OpenAI returned an empty analysis."]},
+                error_code=500,
+            )
+        logger.info(f"Streamed written prompt for {stock_ticker} ({len(text)} chars)")
+        if self.analysis_cache is not None:
+            self.analysis_cache.set(cache_key, text)
+
+    def _written_prompt(self, stock_ticker: str, formatted_html: str) -> str:
+        return f"""
+        I have scraped several Google News articles related to the stock {stock_ticker}. Please provide the following:
+
+        1. A concise summary of the 3 main key points from these news articles. Prefix this with a '###' header, named "Summary:".
+        2. An analysis of the sentiment (ecstatic, positive, neutral, negative, disastrous) of the articles based on how they affect the stock's outlook. Prefix this with a '###' header, named "Sentiment Analysis: <Your evaluation>".
+        {formatted_html}
+        """
+
+    def generate_written_prompts_batch(
+        self, stocks: list[tuple[str, str, str]], batch_size: int = 5
+    ) -> dict[str, str]:
+        """
+        Generate written prompts for many stocks with one request per chunk.
+
+        Each chunk of `batch_size` stocks is sent as a single prompt and the
+        answer is split back into per-stock sections, in the same
+        "Summary:" / "Sentiment Analysis:" format as `generate_written_prompt`.
+        Cached stocks are skipped, and stocks missing from a batched answer
+        fall back to an individual request.
+
+        Sections and results are labelled with the full stock name, since the
+        same ticker can be listed on several exchanges. The cache is keyed by
+        ticker, like `generate_written_prompt`, so both share their entries.
+
+        Parameters
+        ----------
+        stocks : list[tuple[str, str, str]]
+            (full_name, ticker, formatted_html) triples, with unique full names
+            (EXCHANGE:TICKER)
+        batch_size : int, optional
+            max number of stocks per request, by default 5
+
+        Returns
+        -------
+        dict[str, str]
+            written prompt keyed by full name
+        """
+        results: dict[str, str] = {}
+        pending: list[tuple[str, str, str]] = []
+        for full_name, stock_ticker, formatted_html in stocks:
+            cached = None
+            if self.analysis_cache is not None:
+                cached = self.analysis_cache.get(
+                    self._analysis_cache_key(stock_ticker, formatted_html)
+                )
+            if cached:
+                results[full_name] = cached
+            else:
+                pending.append((full_name, stock_ticker, formatted_html))
+
+        batch_size = max(1, batch_size)
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            sections = self._generate_written_prompt_chunk(chunk)
+
+            for full_name, stock_ticker, formatted_html in chunk:
+                text = sections.get(full_name.upper())
+                if not text:
+                    logger.info(
+                        f"{full_name} missing from batched answer, requesting it alone"
+                    )
+                    text = self.generate_written_prompt(stock_ticker, formatted_html)
+                elif self.analysis_cache is not None:
+                    self.analysis_cache.set(
+                        self._analysis_cache_key(stock_ticker, formatted_html), text
+                    )
+                results[full_name] = text
+
+        return results
+
+    def _generate_written_prompt_chunk(
+        self, chunk: list[tuple[str, str, str]]
+    ) -> dict[str, str]:
+        """Send one batched prompt and split the answer into per-stock sections."""
+        if len(chunk) == 1:
+            full_name, stock_ticker, formatted_html = chunk[0]
+            return {
+                full_name.upper(): self.generate_written_prompt(
+                    stock_ticker, formatted_html
+                )
+            }
+
+        articles = "\n\n".join(
+            f"=== STOCK: {full_name} ===\n{formatted_html}"
+            for full_name, _, formatted_html in chunk
+        )
+        PROMPT = f"""
+        I have scraped several Google News articles for each of the following stocks: {", ".join(name for name, _, _ in chunk)}. For EACH stock, please provide the following:
+
+        1. A concise summary of the 3 main key points from these news articles. Prefix this with a '###' header, named "Summary:".
+        2. An analysis of the sentiment (ecstatic, positive, neutral, negative, disastrous) of the articles based on how they affect the stock's outlook. Prefix this with a '###' header, named "Sentiment Analysis: <Your evaluation>".
+
+        Start each stock's answer with a line of the form "=== STOCK: <EXCHANGE:TICKER> ===", using the exact name from the section header below, in the same order as below, and do not write anything outside these sections.
+
+        {articles}
+        """
+
+        try:
+            response: Response = self.client.responses.create(
+                model=WRITTEN_PROMPT_MODEL,
+                input=[{"role": "user", "content": PROMPT}],
+                temperature=0.7,
+            )
+        except Exception as e:
+            logger.error(f"Batched written prompt failed: {e}")
+            return {}
+
+        logger.info(f"Generated batched written prompt for {len(chunk)} stocks")
+        return self.split_batched_written_prompt(
+            self._extract_output_text(response) or ""
+        )
+
+    @staticmethod
+    def split_batched_written_prompt(text: str) -> dict[str, str]:
+        """
+        Split a batched answer on its "=== STOCK: <stock name> ===" markers.
+
+        Parameters
+        ----------
+        text : str
+            the batched answer
+
+        Returns
+        -------
+        dict[str, str]
+            section text keyed by upper-cased stock name
+        """
+        sections: dict[str, str] = {}
+        markers = list(BATCH_SECTION_PATTERN.finditer(text))
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+            section = text[marker.end() : end].strip()
+            if section:
+                sections[marker.group(1).strip().upper()] = section
+        return sections
+
+    def _extract_output_text(self, response: Response) -> str | None:
+        """Return the output text of a response, or None on refusal / empty output."""
         if response.output and len(response.output) > 0:
             assert type(response.output[0]) is ResponseOutputMessage
             response_output: ResponseOutputMessage = response.output[0]
@@ -64,14 +335,11 @@ class OpenAIService:
                 )
         else:
             logger.error(f"OpenAI response has no output: {response}")
+        return None
 
-        if retry_count < 3:
-            time.sleep(2**retry_count)
-            return self.generate_written_prompt(
-                stock_ticker, formatted_html, retry_count=retry_count + 1
-            )
-
-        return ""
+    def _analysis_cache_key(self, stock_ticker: str, formatted_html: str) -> str:
+        html_hash = hashlib.sha256(formatted_html.encode("utf-8")).hexdigest()
+        return f"{stock_ticker.upper()}:{WRITTEN_PROMPT_MODEL}:{html_hash}"
 
     def generate_image_prompt(self, request: GenerateImageRequest, retry_count=0):
         """
@@ -94,7 +362,7 @@ class OpenAIService:
         prompt = TEMPLATE.format(request.text_prompt, request.sentiment.value)
 
         response: ImagesResponse = self.client.images.generate(
-            model="dall-e-3",
+            model=IMAGE_PROMPT_MODEL,
             prompt=prompt,
             n=1,
             size="1024x1024",
@@ -1,24 +1,90 @@
+import re
+from functools import lru_cache
+
 import bs4
 
 from app.models.request.generate_image_request import SentimentEnum
 from app.models.request.stock_request import StockRequestInfo
+from app.services.news_html_extractor import extract_first_child_div_texts
+from app.settings import Settings
+
+HTML_EXTRACTOR_SOUP = "soup"
+HTML_EXTRACTOR_STREAMING = "streaming"
+
+SENTIMENT_ANCHOR = "sentiment"
+
+# "disastrous" is the only keyword that can overlap the anchor
+# ("disastrousentiment"), so its final "s" is matched by lookahead and left
+# for the anchor.
+SENTIMENT_KEYWORDS = {
+    "ecstatic": SentimentEnum.ECSTATIC,
+    "disastrou": SentimentEnum.DISASTROUS,
+    "positive": SentimentEnum.POSITIVE,
+    "negative": SentimentEnum.NEGATIVE,
+    "neutral": SentimentEnum.NEUTRAL,
+}
+
+SENTIMENT_PATTERN = re.compile(
+    "sentiment|ecstatic|disastrou(?=s)|positive|negative|neutral"
+)
+
+
+@lru_cache(maxsize=1024)
+def unwanted_elements_for_stock(ticker: str, long_name: str) -> tuple[str, ...]:
+    """
+    The Google News page chrome plus the stock's own ticker and name.
+
+    Built once per stock and reused across calls.
+    """
+    return tuple(
+        filter(
+            None,
+            [
+                "\n",
+                "  More",
+                "  ",
+                "About Google",
+                "Get the iOS app",
+                "For you",
+                "(" + ticker + ")",
+                long_name,
+                "Get the Android app",
+                "FollowingSingaporeWorldLocalBusinessTechnologyEntertainmentSportsScienceHealth",
+            ],
+        )
+    )
 
 
 class ParserService:
+    def __init__(self):
+        self.settings = Settings().get_settings()
+
     def format_html(self, stock: StockRequestInfo, txt: str):
-        UNWANTED_ELEMENTS = [
-            "\n",
-            "  More",
-            "  ",
-            "About Google",
-            "Get the iOS app",
-            "For you",
-            "(" + stock.ticker + ")",
-            stock.long_name,
-            "Get the Android app",
-            "FollowingSingaporeWorldLocalBusinessTechnologyEntertainmentSportsScienceHealth",
-        ]
+        return self.scrub(stock, " ".join(self.extract_headlines(txt)))
 
+    def extract_headlines(self, txt: str) -> list[str]:
+        """
+        Extract the unique texts of every div's first child div.
+
+        Uses the single-pass streaming extractor unless HTML_EXTRACTOR is set
+        to "soup".
+
+        Parameters
+        ----------
+        txt : str
+            The raw HTML.
+
+        Returns
+        -------
+        list[str]
+            The unique, stripped texts in document order.
+        """
+        if str(self.settings.HTML_EXTRACTOR) == HTML_EXTRACTOR_SOUP:
+            return self._extract_headlines_soup(txt)
+        return extract_first_child_div_texts(txt)
+
+    def _extract_headlines_soup(self, txt: str) -> list[str]:
+        """BeautifulSoup implementation of `extract_headlines`, builds the full tree."""
         soup = bs4.BeautifulSoup(txt, features="html.parser")
 
         for script in soup(["script", "style"]):
@@ -29,16 +95,35 @@ class ParserService:
             for element in soup.find_all("div")
             if element.find("div") is not None
         ]
-        aria_labels_set = set(
-            [element.find("div").text.strip() for element in aria_labels]
+        return list(
+            dict.fromkeys(element.find("div").text.strip() for element in aria_labels)
         )
 
-        aria_labels_string = " ".join(aria_labels_set)
+    def scrub(self, stock: StockRequestInfo, text: str) -> str:
+        """
+        Remove page chrome and the stock's own name from the text.
+
+        The pattern list is built once per stock. Patterns are removed with
+        `str.replace`, which returns the text uncopied when a pattern is
+        absent; see `benchmarks/bench_scrubber.py` for why this is kept over a
+        single alternation regex.
 
+        Parameters
+        ----------
+        stock : StockRequestInfo
+            The stock the text is about.
+        text : str
+            The text to clean.
+
+        Returns
+        -------
+        str
+            The cleaned text.
+        """
         # remove unwanted elements
-        for r in UNWANTED_ELEMENTS:
-            aria_labels_string = aria_labels_string.replace(r, "")
-        return aria_labels_string
+        for r in unwanted_elements_for_stock(stock.ticker, stock.long_name):
+            text = text.replace(r, "")
+        return text
 
     def split_text_for_images(self, text: str) -> list[str]:
         """Split text into numbered points.
@@ -100,24 +185,43 @@ class ParserService:
         """
         text = text.lower()
 
-        if text.find("sentiment") != -1:
-            narrowed_text = text[text.find("sentiment") + len("sentiment") :]
-            sentiment_of_narrowed_text = self.find_sentiment(narrowed_text)
-            if sentiment_of_narrowed_text != SentimentEnum.NEUTRAL:
-                return sentiment_of_narrowed_text
-
-        # find first instance of word in text
-        first_instances = {
-            SentimentEnum.ECSTATIC: text.find("ecstatic"),
-            SentimentEnum.DISASTROUS: text.find("disastrous"),
-            SentimentEnum.POSITIVE: text.find("positive"),
-            SentimentEnum.NEGATIVE: text.find("negative"),
-            SentimentEnum.NEUTRAL: text.find("neutral"),
-        }
-        first_instances = {k: v for k, v in first_instances.items() if v != -1}
-
-        if first_instances:
-            first_sentiment = min(first_instances, key=lambda k: first_instances[k])
-            return first_sentiment
-        else:
-            return SentimentEnum.NEUTRAL
+        # The sentiment is the first keyword after the last "sentiment" anchor.
+        # If that is missing or neutral, fall back to the first keyword after
+        # the previous anchor, and so on, and finally to the first keyword of
+        # the whole text. Anchors with no keyword between them share the same
+        # next keyword, so one forward scan is enough.
+        first_keyword: SentimentEnum | None = None
+        latest_non_neutral: SentimentEnum | None = None
+        anchor_pending = False
+
+        for match in SENTIMENT_PATTERN.finditer(text):
+            word = match.group()
+            if word == SENTIMENT_ANCHOR:
+                anchor_pending = True
+                continue
+
+            sentiment = SENTIMENT_KEYWORDS[word]
+            if first_keyword is None:
+                first_keyword = sentiment
+            if anchor_pending:
+                anchor_pending = False
+                if sentiment != SentimentEnum.NEUTRAL:
+                    latest_non_neutral = sentiment
+
+        return latest_non_neutral or first_keyword or SentimentEnum.NEUTRAL
+
+    def find_sentiments(self, texts: list[str]) -> list[SentimentEnum]:
+        """
+        Find the sentiment of many texts at once.
+
+        Parameters
+        ----------
+        texts : list[str]
+            The texts to analyze.
+
+        Returns
+        -------
+        list[SentimentEnum]
+            The sentiment enums, in the same order as the texts.
+        """
+        return [self.find_sentiment(text) for text in texts]
@@ -1,24 +1,61 @@
 # Class to handle input/output operations
 
+import hashlib
+import io
 import json
 import os
+import time
 
-import requests
-import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
 
 from app.errors.project_io_error import ProjectIOError
+from app.models.request.slide_render_request import SlideRenderRequest
 from app.models.request.stock_request import StockRequestInfo
+from app.services.cache_service import PersistentTTLCache
+from app.services.font_service import FontService
+from app.services.http_client_service import HttpClientService
+from app.services.scratch_workspace_service import ScratchWorkspace
+from app.services.text_layout_service import TextLayoutService
 from app.settings import Settings
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Outline widths drawn around overlay text for readability
+STROKE_WIDTH = 4
+BOLD_STROKE_WIDTH = 6
+
+# Slide encodings supported by encode_image
+IMAGE_FORMATS = {
+    "png": {"pil_format": "PNG", "content_type": "image/png", "extension": "png"},
+    "jpeg": {"pil_format": "JPEG", "content_type": "image/jpeg", "extension": "jpg"},
+    "webp": {"pil_format": "WEBP", "content_type": "image/webp", "extension": "webp"},
+}
+
+# Text readability modes of render_text_overlay
+READABILITY_STROKE = "stroke"
+READABILITY_BAND = "band"
+
 
 class ProjectIoService:
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: HttpClientService,
+        font_service: FontService,
+        text_layout_service: TextLayoutService,
+        logo_layer_cache: PersistentTTLCache | None = None,
+    ):
         self.settings = Settings().get_settings()
+        self.http_client = http_client
+        self.font_service = font_service
+        self.text_layout_service = text_layout_service
+        self.logo_layer_cache = logo_layer_cache
 
         self.db = {}
         self.stocks = {}
@@ -74,7 +111,12 @@ class ProjectIoService:
         """
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    def download_image(self, image_url: str, filename: str = "filename.png") -> str:
+    def download_image(
+        self,
+        image_url: str,
+        filename: str = "filename.png",
+        workspace: ScratchWorkspace | None = None,
+    ) -> str:
         """
         Downloads an image from the given URL.
 
@@ -84,6 +126,8 @@ class ProjectIoService:
             url of the image
         filename : str, optional
             file name, by default "filename"
+        workspace : ScratchWorkspace | None, optional
+            scratch workspace to write into, by default None (current directory)
 
         Returns
         -------
@@ -95,9 +139,10 @@ class ProjectIoService:
         ProjectIOError
             If the image could not be downloaded.
         """
+        img_data = self.download_image_bytes(image_url)
+        if workspace is not None:
+            return workspace.write_bytes(filename, img_data)
         try:
-            img_data = requests.get(image_url).content
-
             with open(filename, "wb") as handler:
                 handler.write(img_data)
 
@@ -105,6 +150,152 @@ class ProjectIoService:
         except Exception as e:
             raise ProjectIOError(str(e))
 
+    def download_image_bytes(self, image_url: str) -> bytes:
+        """
+        Downloads an image from the given URL into memory.
+
+        Parameters
+        ----------
+        image_url : str
+            url of the image
+
+        Returns
+        -------
+        bytes
+            the encoded image
+
+        Raises
+        ------
+        ProjectIOError
+            If the image could not be downloaded.
+        """
+        try:
+            response = self.http_client.get(image_url)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            raise ProjectIOError(str(e))
+
+    def open_image(self, image_url: str) -> Image.Image:
+        """
+        Downloads and decodes an image without touching the disk.
+
+        Parameters
+        ----------
+        image_url : str
+            url of the image
+
+        Returns
+        -------
+        Image.Image
+            the decoded image
+
+        Raises
+        ------
+        ProjectIOError
+            If the image could not be downloaded or decoded.
+        """
+        return self.decode_image(self.download_image_bytes(image_url))
+
+    def decode_image(self, img_data: bytes) -> Image.Image:
+        """
+        Decodes an encoded image held in memory.
+
+        Parameters
+        ----------
+        img_data : bytes
+            the encoded image
+
+        Returns
+        -------
+        Image.Image
+            the decoded image
+
+        Raises
+        ------
+        ProjectIOError
+            If the image could not be decoded.
+        """
+        try:
+            image = Image.open(io.BytesIO(img_data))
+            image.load()
+            return image
+        except Exception as e:
+            raise ProjectIOError(str(e))
+
+    def encode_image(
+        self, image: Image.Image, image_format: str | None = None
+    ) -> io.BytesIO:
+        """
+        Encodes an image into an in-memory buffer.
+
+        The encoder options come from the SLIDE_* settings: PNG compress level,
+        JPEG quality / chroma subsampling (optimized, progressive) and WebP
+        quality / method. Encode time and size are logged.
+
+        Parameters
+        ----------
+        image : Image.Image
+            the image to encode
+        image_format : str | None, optional
+            'png', 'jpeg' or 'webp', by default SLIDE_IMAGE_FORMAT
+
+        Returns
+        -------
+        io.BytesIO
+            the encoded image, rewound to the start
+        """
+        image_format = (image_format or self.settings.SLIDE_IMAGE_FORMAT).lower()
+        if image_format not in IMAGE_FORMATS:
+            raise ProjectIOError(f"Unsupported image format: {image_format}")
+
+        quality = int(self.settings.SLIDE_IMAGE_QUALITY)
+        if image_format == "jpeg":
+            # JPEG has no alpha channel
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            options = {
+                "quality": quality,
+                "subsampling": self.settings.SLIDE_JPEG_SUBSAMPLING,
+                "optimize": True,
+                "progressive": True,
+            }
+        elif image_format == "webp":
+            options = {
+                "quality": quality,
+                "method": int(self.settings.SLIDE_WEBP_METHOD),
+            }
+        else:
+            options = {"compress_level": int(self.settings.SLIDE_PNG_COMPRESS_LEVEL)}
+
+        start = time.perf_counter()
+        buffer = io.BytesIO()
+        image.save(buffer, format=IMAGE_FORMATS[image_format]["pil_format"], **options)
+        buffer.seek(0)
+        logger.info(
+            f"Encoded {image.width}x{image.height} image as {image_format} in "
+            f"{(time.perf_counter() - start) * 1000:.1f} ms, "
+            f"{buffer.getbuffer().nbytes} bytes"
+        )
+        return buffer
+
+    def slide_content_type(self, image_format: str | None = None) -> str:
+        """
+        Content type of images encoded by `encode_image`.
+
+        Parameters
+        ----------
+        image_format : str | None, optional
+            'png', 'jpeg' or 'webp', by default SLIDE_IMAGE_FORMAT
+
+        Returns
+        -------
+        str
+            the MIME type
+        """
+        image_format = (image_format or self.settings.SLIDE_IMAGE_FORMAT).lower()
+        return IMAGE_FORMATS[image_format]["content_type"]
+
     def delete_file(self, filename: str):
         """
         Deletes the file with the given filename.
@@ -117,50 +308,6 @@ class ProjectIoService:
         if os.path.exists(filename):
             os.remove(filename)
 
-    def _find_font_path(self) -> str | None:
-        """Best-effort locate a TrueType font on this system.
-
-        Checks an env override first, then common Linux/Mac/Windows locations,
-        and finally known package-installed fonts like DejaVu.
-        Returns a path or None if nothing suitable is found.
-        """
-        candidates = [
-            os.environ.get("FONT_PATH"),
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Debian/Ubuntu
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-            "/Library/Fonts/Arial.ttf",  # macOS (if installed)
-            "/System/Library/Fonts/Supplemental/Arial.ttf",  # macOS
-            "C:/Windows/Fonts/arial.ttf",  # Windows
-            "arial.ttf",
-        ]
-        for path in candidates:
-            if path and os.path.exists(path):
-                return path
-        return None
-
-    def _find_bold_font_path(self) -> str | None:
-        """Best-effort locate a TrueType bold font on this system.
-
-        Checks an env override first, then common Linux/Mac/Windows locations,
-        and finally known package-installed fonts like DejaVu.
-        Returns a path or None if nothing suitable is found.
-        """
-        candidates = [
-            os.environ.get("BOLD_FONT_PATH"),
-            "/usr/share/fonts/truetype/dejavu/DejaVuSerif-Bold.ttf",  # Debian/Ubuntu
-            "/usr/share/fonts/truetype/liberation/LiberationSerif-Bold.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSerifBold.ttf",
-            "/Library/Fonts/Arial Bold.ttf",  # macOS (if installed)
-            "/System/Library/Fonts/Supplemental/Arial Bold.ttf",  # macOS
-            "C:/Windows/Fonts/arialbd.ttf",  # Windows
-            "arialbd.ttf",
-        ]
-        for path in candidates:
-            if path and os.path.exists(path):
-                return path
-        return None
-
     def text_overlay(
         self,
         image_filepath: str,
@@ -168,123 +315,193 @@ class ProjectIoService:
         size: int = 35,
         padding: int = 40,
         color: tuple[int, int, int] = (255, 255, 255),
-        line_width: int = 50,
         line_spacing: int = 6,
         bolded_text: str = "",
+        workspace: ScratchWorkspace | None = None,
     ):
-        """Draw wrapped text at the bottom-middle of the image.
+        """Draw wrapped text at the bottom-middle of the image file.
 
-        The text is wrapped so each line has <= line_width characters (word based).
+        See `render_text_overlay` for the layout. Returns the path of the new
+        image, saved next to the original. If a workspace is given, the image is
+        encoded in SLIDE_IMAGE_FORMAT and the write counts against the
+        workspace's disk-usage cap.
         """
-
-        logger.info(f"Adding text overlay to image: {text}")
         image = Image.open(image_filepath)
-        draw = ImageDraw.Draw(image)
+        image = self.render_text_overlay(
+            image,
+            text=text,
+            size=size,
+            padding=padding,
+            color=color,
+            line_spacing=line_spacing,
+            bolded_text=bolded_text,
+        )
 
-        # Set fonts
-        font = None
-        bold_font = None
-        font_path = self._find_font_path()
-        bold_font_path = self._find_bold_font_path()
-        if font_path:
-            try:
-                font = ImageFont.truetype(font_path, size)
-            except OSError:
-                font = None
-        if bold_font_path:
-            try:
-                bold_font = ImageFont.truetype(bold_font_path, size)
-            except OSError:
-                bold_font = None
-        if font is None:
-            font = ImageFont.load_default()
-        if bold_font is None:
-            bold_font = font
-
-        # Normalize and wrap text into lines of <= line_width characters.
-
-        # Split existing paragraphs, wrap each separately
-        # Build a list of tuples: (line_text, is_bold)
-        wrapped_lines: list[tuple[str, bool]] = []
-
-        # 1) Add bolded_text (if provided) as bold lines
-        bt = (bolded_text or "").strip()
-        if bt:
-            for paragraph in bt.splitlines():
-                paragraph = paragraph.strip()
-                if not paragraph:
-                    wrapped_lines.append(("", True))
-                    continue
-                lines = textwrap.wrap(
-                    paragraph,
-                    width=line_width,
-                    break_long_words=True,
-                    replace_whitespace=True,
-                    drop_whitespace=True,
-                )
-                wrapped_lines.extend((ln, True) for ln in lines)
-
-        # 2) Add the rest of the caption as normal (unbold) lines
-        for paragraph in (text or "").splitlines():
-            paragraph = paragraph.strip()
-            if not paragraph:
-                wrapped_lines.append(("", False))  # preserve blank line
-                continue
-            lines = textwrap.wrap(
-                paragraph,
-                width=line_width,
-                break_long_words=True,
-                replace_whitespace=True,
-                drop_whitespace=True,
+        # Save the modified image
+        output_filepath = image_filepath.replace(".png", "_with_text.png")
+        if workspace is not None:
+            image_format = self.settings.SLIDE_IMAGE_FORMAT.lower()
+            extension = IMAGE_FORMATS.get(image_format, {}).get("extension", "png")
+            return workspace.write_bytes(
+                output_filepath.replace(".png", f".{extension}"),
+                self.encode_image(image).getvalue(),
             )
-            wrapped_lines.extend((ln, False) for ln in lines)
-
-        # Measure total height
-        line_heights = []
-        line_widths = []
-        for line, is_bold in wrapped_lines:
-            active_font = bold_font if is_bold else font
-            if line == "":  # blank line approximate height of a space
-                bbox = draw.textbbox((0, 0), " ", font=active_font)
-            else:
-                bbox = draw.textbbox((0, 0), line, font=active_font)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
-            line_heights.append(h)
-            line_widths.append(w)
-
-        total_text_height = sum(line_heights) + line_spacing * (len(wrapped_lines) - 1)
+        image.save(output_filepath)
+
+        return output_filepath
+
+    def render_text_overlay(
+        self,
+        image: Image.Image,
+        text: str,
+        size: int = 35,
+        padding: int = 40,
+        color: tuple[int, int, int] = (255, 255, 255),
+        line_spacing: int = 6,
+        bolded_text: str = "",
+        fit_text: bool = True,
+        readability: str | None = None,
+    ) -> Image.Image:
+        """Draw wrapped text at the bottom-middle of an in-memory image.
+
+        The text is wrapped to the image width minus padding, measured in pixels.
+        With fit_text, the font size is shrunk (down to TEXT_MIN_FONT_SIZE) until
+        the block fits in the bottom TEXT_BOX_HEIGHT_RATIO of the image.
+
+        readability picks how the text is kept legible, by default
+        TEXT_READABILITY: 'stroke' outlines every glyph in black, 'band' darkens
+        a gradient band behind the text block and draws plain text, which is
+        much cheaper to render.
+
+        The image is drawn on in place and returned, unless it has to be
+        converted to RGB first for the band.
+        """
+
+        logger.info(f"Adding text overlay to image: {text}")
+        readability = readability or self.settings.TEXT_READABILITY
+        if readability == READABILITY_BAND and image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
         img_w, img_h = image.size
-        start_y = max(0, img_h - total_text_height - padding)
 
-        # Draw each line centered with a black outline (stroke) for readability
+        # Keep room for the widest (bold) stroke on both sides
+        max_width = max(1, img_w - 2 * (padding + BOLD_STROKE_WIDTH))
+        max_height = max(
+            1, int(img_h * float(self.settings.TEXT_BOX_HEIGHT_RATIO)) - padding
+        )
+        if fit_text:
+            layout = self.text_layout_service.fit(
+                text,
+                bolded_text,
+                max_size=size,
+                min_size=min(size, int(self.settings.TEXT_MIN_FONT_SIZE)),
+                max_width=max_width,
+                max_height=max_height,
+                line_spacing=line_spacing,
+            )
+        else:
+            layout = self.text_layout_service.layout(
+                text, bolded_text, size, max_width, line_spacing, max_height
+            )
+
+        font = self.font_service.get_font(layout.size)
+        bold_font = self.font_service.get_bold_font(layout.size)
+
+        start_y = max(0, img_h - layout.height - padding)
+
+        if readability == READABILITY_BAND:
+            self.darken_band(image, top=start_y - padding)
+
+        # Draw each line centered, with a black outline (stroke) unless the
+        # band already keeps it readable
+        draw = ImageDraw.Draw(image)
         current_y = start_y
 
-        for i, (line, is_bold) in enumerate(wrapped_lines):
-            w = line_widths[i]
-            h = line_heights[i]
-            x = max(0, (img_w - w) / 2)
-            if line:
-                active_font = bold_font if is_bold else font
-                active_stroke_width = 6 if is_bold else 4
+        for line in layout.lines:
+            x = max(0, (img_w - line.width) / 2)
+            if line.text:
+                stroke_width = 0
+                if readability != READABILITY_BAND:
+                    stroke_width = BOLD_STROKE_WIDTH if line.is_bold else STROKE_WIDTH
                 draw.text(
                     (x, current_y),
-                    line,
+                    line.text,
                     fill=color,
-                    font=active_font,
-                    stroke_width=active_stroke_width,
+                    font=bold_font if line.is_bold else font,
+                    stroke_width=stroke_width,
                     stroke_fill=(0, 0, 0),
                 )
-            current_y += h + line_spacing
+            current_y += line.height + line_spacing
 
-        # Save the modified image
-        output_filepath = image_filepath.replace(".png", "_with_text.png")
-        image.save(output_filepath)
+        return image
 
-        return output_filepath
+    def darken_band(self, image: Image.Image, top: int) -> None:
+        """Darken the image from `top` to the bottom, with a gradient fade-in.
+
+        The band fades in over TEXT_BAND_FADE pixels above `top` and then stays
+        at TEXT_BAND_OPACITY, i.e. black composited at that alpha. Done with one
+        vectorized NumPy multiply on the affected rows, in place.
+
+        Parameters
+        ----------
+        image : Image.Image
+            RGB or RGBA image.
+        top : int
+            First row of the fully darkened part of the band.
+        """
+        img_w, img_h = image.size
+        fade = int(self.settings.TEXT_BAND_FADE)
+        opacity = float(self.settings.TEXT_BAND_OPACITY)
+        band_top = max(0, top - fade)
+        if band_top >= img_h:
+            return
+
+        rows = np.arange(band_top, img_h, dtype=np.float32)
+        alpha = opacity * np.clip((rows - (top - fade)) / max(1, fade), 0.0, 1.0)
+
+        region = np.asarray(image.crop((0, band_top, img_w, img_h)), dtype=np.float32)
+        # RGBA keeps its own alpha channel untouched
+        region[..., :3] *= (1.0 - alpha)[:, None, None]
+        image.paste(Image.fromarray(region.astype(np.uint8)), (0, band_top))
+
+    def render_slides(self, slides: list[SlideRenderRequest]) -> list[io.BytesIO]:
+        """Draw the text of every slide and encode it, in parallel.
+
+        Text drawing is cheap next to PNG encoding, and Pillow releases the GIL
+        while it compresses, so slides are rendered on a thread pool of
+        SLIDE_RENDER_WORKERS threads.
+
+        Parameters
+        ----------
+        slides : list[SlideRenderRequest]
+            The slides, in carousel order.
+
+        Returns
+        -------
+        list[io.BytesIO]
+            The encoded slides, in the same order.
+        """
+        if not slides:
+            return []
+
+        max_workers = max(1, min(len(slides), int(self.settings.SLIDE_RENDER_WORKERS)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._render_slide, slides))
+
+    def _render_slide(self, slide: SlideRenderRequest) -> io.BytesIO:
+        image = self.render_text_overlay(
+            slide.image,
+            text=slide.text,
+            bolded_text=slide.bolded_text,
+            readability=slide.readability,
+        )
+        return self.encode_image(image)
 
     def image_overlay(
-        self, background_image_path: str, overlay_image_path: str, output_file_path: str
+        self,
+        background_image_path: str,
+        overlay_image_path: str,
+        output_file_path: str,
+        workspace: ScratchWorkspace | None = None,
     ) -> str:
         """Overlay an image on top of a background image at the center.
 
@@ -294,6 +511,10 @@ class ProjectIoService:
             Path to the background image.
         overlay_image_path : str
             Path to the overlay image.
+        output_file_path : str
+            Path of the output image, or its file name when a workspace is given.
+        workspace : ScratchWorkspace | None, optional
+            Scratch workspace to write into, by default None.
 
         Returns
         -------
@@ -303,12 +524,67 @@ class ProjectIoService:
         logger.info(
             f"Overlaying image {overlay_image_path} on background {background_image_path}"
         )
-        background = Image.open(background_image_path).convert("RGBA")
-        overlay = Image.open(overlay_image_path).convert("RGBA")
+        if background_image_path == self.settings.BACKGROUND_IMAGE_PATH:
+            background = self.background_image()
+        else:
+            background = Image.open(background_image_path)
+        combined = self.compose_image_overlay(
+            background=background,
+            overlay=Image.open(overlay_image_path),
+        )
+
+        # Save the result
+        if workspace is not None:
+            return workspace.write_bytes(
+                output_file_path, self.encode_image(combined, "png").getvalue()
+            )
+        combined.save(output_file_path)
+
+        return output_file_path
+
+    def compose_image_overlay(
+        self, background: Image.Image, overlay: Image.Image
+    ) -> Image.Image:
+        """Overlay an in-memory image on top of a background at the center.
+
+        Parameters
+        ----------
+        background : Image.Image
+            The background image.
+        overlay : Image.Image
+            The overlay image.
+
+        Returns
+        -------
+        Image.Image
+            The combined RGB image.
+        """
+        return self.paste_overlay(
+            background, self.fit_overlay(overlay, background.size)
+        )
+
+    def fit_overlay(
+        self, overlay: Image.Image, background_size: tuple[int, int]
+    ) -> Image.Image:
+        """Resize an overlay image for a background of the given size.
+
+        Parameters
+        ----------
+        overlay : Image.Image
+            The overlay image.
+        background_size : tuple[int, int]
+            Width and height of the background.
+
+        Returns
+        -------
+        Image.Image
+            The resized RGBA overlay.
+        """
+        overlay = overlay.convert("RGBA")
 
         # Resize overlay: ensure its shorter side is at least 33% of the background
         # Example: if overlay is landscape (w > h), set its height to 33% of bg height
-        bg_w, bg_h = background.size
+        bg_w, bg_h = background_size
         ov_w, ov_h = overlay.size
 
         min_ratio = 0.25
@@ -333,12 +609,31 @@ class ProjectIoService:
         # Use LANCZOS resampling; Pillow removed the ANTIALIAS alias in newer versions.
         resample_filter = Image.Resampling.LANCZOS
 
-        overlay = overlay.resize((new_ov_w, new_ov_h), resample=resample_filter)
+        return overlay.resize((new_ov_w, new_ov_h), resample=resample_filter)
+
+    def paste_overlay(self, background: Image.Image, overlay: Image.Image) -> Image.Image:
+        """Paste an already resized RGBA overlay at the center of a background.
+
+        Parameters
+        ----------
+        background : Image.Image
+            The background image. It is not modified.
+        overlay : Image.Image
+            The RGBA overlay, as returned by `fit_overlay`.
+
+        Returns
+        -------
+        Image.Image
+            The combined RGB image.
+        """
+        background = background.convert("RGBA")
+        bg_w, bg_h = background.size
+        ov_w, ov_h = overlay.size
 
         # Calculate position to center the overlay
         position = (
-            (bg_w - new_ov_w) // 2,
-            (bg_h - new_ov_h) // 2,
+            (bg_w - ov_w) // 2,
+            (bg_h - ov_h) // 2,
         )
 
         # Composite images
@@ -346,7 +641,80 @@ class ProjectIoService:
         combined.paste(background, (0, 0))
         combined.paste(overlay, position, mask=overlay)
 
-        # Save the result
-        combined.convert("RGB").save(output_file_path)
+        return combined.convert("RGB")
 
-        return output_file_path
+    def background_image(self) -> Image.Image:
+        """The decoded BACKGROUND_IMAGE_PATH, loaded once per process.
+
+        Returns
+        -------
+        Image.Image
+            The shared RGBA background. Callers must not draw on it.
+        """
+        return load_background_image(self.settings.BACKGROUND_IMAGE_PATH)
+
+    def compose_intro_slide(
+        self,
+        ticker: str,
+        logo_url: str,
+        load_logo: Callable[[], bytes] | None = None,
+    ) -> Image.Image:
+        """Composite the company logo on the background for the intro slide.
+
+        The resized logo is cached per ticker and logo URL, so a repeat post
+        for the same stock skips the logo download and the LANCZOS resize.
+
+        Parameters
+        ----------
+        ticker : str
+            The stock ticker.
+        logo_url : str
+            URL of the company logo.
+        load_logo : Callable[[], bytes] | None, optional
+            Returns the encoded logo on a cache miss, e.g. from the company
+            logo cache; by default the logo is downloaded from `logo_url`.
+
+        Returns
+        -------
+        Image.Image
+            The intro slide without text, as a new RGB image.
+
+        Raises
+        ------
+        ProjectIOError
+            If the logo could not be downloaded or decoded.
+        """
+        background = self.background_image()
+        logo_hash = hashlib.sha256(logo_url.encode("utf-8")).hexdigest()
+        key = f"{ticker.upper()}:{logo_hash}:{background.width}x{background.height}"
+
+        logo_png = None
+        if self.logo_layer_cache is not None:
+            logo_png = self.logo_layer_cache.get(key)
+
+        if logo_png is None:
+            source = (
+                self.decode_image(load_logo())
+                if load_logo is not None
+                else self.open_image(logo_url)
+            )
+            logo = self.fit_overlay(source, background.size)
+            if self.logo_layer_cache is not None:
+                self.logo_layer_cache.set(
+                    key, self.encode_image(logo, "png").getvalue()
+                )
+        else:
+            logger.info(f"Intro logo cache hit for {ticker}")
+            logo = Image.open(io.BytesIO(logo_png))
+            logo.load()
+
+        return self.paste_overlay(background, logo)
+
+
+@lru_cache(maxsize=4)
+def load_background_image(path: str) -> Image.Image:
+    """Decode a background asset once; the result is shared, so never draw on it."""
+    logger.info(f"Loading background image {path}")
+    image = Image.open(path).convert("RGBA")
+    image.load()
+    return image
@@ -0,0 +1,209 @@
+"""
+Compact scraped news text before it is pasted into an LLM prompt.
+
+Headlines are de-duplicated with MinHash over word shingles, ranked by TF-IDF
+cosine similarity to the stock, and the best ones are kept until the token
+budget is spent.
+"""
+
+import math
+import re
+import zlib
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.logging_config import get_logger
+from app.models.request.stock_request import StockRequestInfo
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Rough average for English text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+# Smallest prime above 2**32, for the (a * x + b) mod p hash family of MinHash.
+# Coefficients stay below 2**31 so that products fit in uint64.
+HASH_PRIME = 4294967311
+
+
+class CompactionResult(BaseModel):
+    text: str
+    input_tokens: int
+    output_tokens: int
+    kept_headlines: int
+    dropped_duplicates: int
+    dropped_over_budget: int
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate, good enough for budgeting."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class PromptCompactionService:
+    """
+    Deduplicates, ranks and truncates headlines to a token budget.
+    """
+
+    def __init__(self) -> None:
+        self.settings = Settings().get_settings()
+        self.num_perm = int(self.settings.PROMPT_MINHASH_PERMUTATIONS)
+        self.shingle_size = int(self.settings.PROMPT_SHINGLE_SIZE)
+        self.duplicate_threshold = float(self.settings.PROMPT_DUPLICATE_THRESHOLD)
+
+        rng = np.random.default_rng(seed=1)
+        self._hash_a = rng.integers(1, 1 << 31, size=self.num_perm, dtype=np.uint64)
+        self._hash_b = rng.integers(0, 1 << 31, size=self.num_perm, dtype=np.uint64)
+
+    def compact(
+        self,
+        stock: StockRequestInfo,
+        headlines: list[str],
+        token_budget: int | None = None,
+    ) -> CompactionResult:
+        """
+        Compact headlines for the given stock.
+
+        Parameters
+        ----------
+        stock : StockRequestInfo
+            the stock the headlines are about
+        headlines : list[str]
+            raw headline texts
+        token_budget : int | None, optional
+            max estimated tokens of the output, by default PROMPT_TOKEN_BUDGET
+
+        Returns
+        -------
+        CompactionResult
+            compacted text and token counts
+        """
+        budget = int(
+            self.settings.PROMPT_TOKEN_BUDGET if token_budget is None else token_budget
+        )
+        headlines = [h for h in dict.fromkeys(h.strip() for h in headlines) if h]
+        input_tokens = estimate_tokens(" ".join(headlines))
+
+        unique = self.deduplicate(headlines)
+        ranked = self.rank(stock, unique)
+
+        kept: list[str] = []
+        used_tokens = 0
+        for headline in ranked:
+            cost = estimate_tokens(headline) + 1
+            if budget > 0 and used_tokens + cost > budget:
+                continue
+            kept.append(headline)
+            used_tokens += cost
+
+        text = " ".join(kept)
+        result = CompactionResult(
+            text=text,
+            input_tokens=input_tokens,
+            output_tokens=estimate_tokens(text),
+            kept_headlines=len(kept),
+            dropped_duplicates=len(headlines) - len(unique),
+            dropped_over_budget=len(unique) - len(kept),
+        )
+        logger.info(
+            f"Compacted prompt for {stock.ticker}: {result.input_tokens} -> "
+            f"{result.output_tokens} tokens, kept {result.kept_headlines}, "
+            f"dropped {result.dropped_duplicates} duplicates and "
+            f"{result.dropped_over_budget} over budget"
+        )
+        return result
+
+    def deduplicate(self, headlines: list[str]) -> list[str]:
+        """
+        Drop near-duplicate headlines, keeping the first occurrence.
+
+        Two headlines are duplicates when the estimated Jaccard similarity of
+        their word shingles reaches PROMPT_DUPLICATE_THRESHOLD.
+
+        Parameters
+        ----------
+        headlines : list[str]
+            headline texts
+
+        Returns
+        -------
+        list[str]
+            headlines without near-duplicates, in original order
+        """
+        if len(headlines) < 2:
+            return list(headlines)
+
+        signatures = np.stack([self._minhash(h) for h in headlines])
+        kept_indices: list[int] = []
+        for i in range(len(headlines)):
+            if kept_indices:
+                similarity = (signatures[kept_indices] == signatures[i]).mean(axis=1)
+                if similarity.max() >= self.duplicate_threshold:
+                    continue
+            kept_indices.append(i)
+        return [headlines[i] for i in kept_indices]
+
+    def rank(self, stock: StockRequestInfo, headlines: list[str]) -> list[str]:
+        """
+        Order headlines by TF-IDF cosine similarity to the stock's ticker and name.
+
+        Parameters
+        ----------
+        stock : StockRequestInfo
+            the stock to rank against
+        headlines : list[str]
+            headline texts
+
+        Returns
+        -------
+        list[str]
+            headlines, most relevant first (stable for equal scores)
+        """
+        if len(headlines) < 2:
+            return list(headlines)
+
+        documents = [WORD_PATTERN.findall(h.lower()) for h in headlines]
+        vocabulary: dict[str, int] = {}
+        for words in documents:
+            for word in words:
+                vocabulary.setdefault(word, len(vocabulary))
+        if not vocabulary:
+            return list(headlines)
+
+        term_counts = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+        for row, words in enumerate(documents):
+            for word in words:
+                term_counts[row, vocabulary[word]] += 1
+
+        document_frequency = np.count_nonzero(term_counts, axis=0)
+        idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+        tfidf = term_counts * idf
+        tfidf /= np.linalg.norm(tfidf, axis=1, keepdims=True) + 1e-9
+
+        query = np.zeros(len(vocabulary), dtype=np.float32)
+        for word in WORD_PATTERN.findall(f"{stock.ticker} {stock.long_name}".lower()):
+            if word in vocabulary:
+                query[vocabulary[word]] += 1
+        query *= idf
+        query /= np.linalg.norm(query) + 1e-9
+
+        scores = tfidf @ query
+        order = np.argsort(-scores, kind="stable")
+        return [headlines[i] for i in order]
+
+    def _minhash(self, text: str) -> np.ndarray:
+        words = WORD_PATTERN.findall(text.lower())
+        size = self.shingle_size
+        shingles = {
+            " ".join(words[i : i + size])
+            for i in range(max(1, len(words) - size + 1))
+        }
+        hashes = np.array(
+            [zlib.crc32(s.encode("utf-8")) for s in shingles], dtype=np.uint64
+        )
+        # (a * x + b) mod p for every permutation / shingle pair, then min per permutation
+        permuted = (np.outer(self._hash_a, hashes) + self._hash_b[:, None]) % HASH_PRIME
+        return permuted.min(axis=1)
@@ -0,0 +1,229 @@
+"""
+Deferred deletion of temporary S3 objects.
+
+Posting a carousel leaves its slide objects in S3. Instead of deleting them
+one by one on the request path, their keys are queued here and a background
+thread deletes them with batched DeleteObjects requests. Failed deletes are
+retried with exponential backoff, and the backlog is written through to a
+sqlite file so keys queued before a restart are still deleted afterwards.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from app.logging_config import get_logger
+from app.services.aws_service import DELETE_OBJECTS_MAX_KEYS, AWSService
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+TABLE_NAME = "s3_cleanup_backlog"
+
+
+class S3CleanupService:
+    """
+    Background queue of S3 objects to delete.
+
+    Parameters
+    ----------
+    aws_service : AWSService
+        client used for the deletes
+    db_path : str | None, optional
+        path to the sqlite file holding the backlog, by default None (memory only)
+    """
+
+    def __init__(self, aws_service: AWSService, db_path: str | None = None) -> None:
+        self.settings = Settings().get_settings()
+        self.aws_service = aws_service
+        self.interval = float(self.settings.S3_CLEANUP_INTERVAL_SECONDS)
+        self.retry_base = float(self.settings.S3_CLEANUP_RETRY_BASE_SECONDS)
+        self.retry_max = float(self.settings.S3_CLEANUP_RETRY_MAX_SECONDS)
+
+        self.deleted = 0
+        self.failed_attempts = 0
+        self.batches = 0
+
+        # (bucket, object_name) -> (attempts, next_attempt_at)
+        self._pending: dict[tuple[str, str], tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._db: sqlite3.Connection | None = None
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} "
+                    "(bucket TEXT, object_name TEXT, attempts INTEGER, "
+                    "next_attempt_at REAL, PRIMARY KEY (bucket, object_name))"
+                )
+                self._db.commit()
+                for bucket, object_name, attempts, next_attempt_at in self._db.execute(
+                    f"SELECT bucket, object_name, attempts, next_attempt_at "
+                    f"FROM {TABLE_NAME}"
+                ):
+                    self._pending[(bucket, object_name)] = (attempts, next_attempt_at)
+                logger.info(f"S3 cleanup: {len(self._pending)} objects in the backlog")
+            except sqlite3.Error as e:
+                logger.error(f"S3 cleanup: disk backlog unavailable: {e}")
+                self._db = None
+
+    def _persist(self, rows: list[tuple[str, str, int, float]]) -> None:
+        if self._db is None or not rows:
+            return
+        try:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {TABLE_NAME} "
+                "(bucket, object_name, attempts, next_attempt_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"S3 cleanup: failed to persist the backlog: {e}")
+
+    def _forget(self, keys: list[tuple[str, str]]) -> None:
+        if self._db is None or not keys:
+            return
+        try:
+            self._db.executemany(
+                f"DELETE FROM {TABLE_NAME} WHERE bucket = ? AND object_name = ?", keys
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"S3 cleanup: failed to update the backlog: {e}")
+
+    def enqueue(self, bucket: str, object_names: list[str]) -> None:
+        """
+        Queue S3 objects for deletion and return immediately.
+
+        Parameters
+        ----------
+        bucket : str
+            bucket name
+        object_names : list[str]
+            object names to delete
+        """
+        if not object_names:
+            return
+        now = time.time()
+        with self._lock:
+            rows = []
+            for object_name in object_names:
+                self._pending[(bucket, object_name)] = (0, now)
+                rows.append((bucket, object_name, 0, now))
+            self._persist(rows)
+        self.start()
+        self._wake.set()
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Delete every queued object that is due, in batches per bucket.
+
+        Parameters
+        ----------
+        force : bool, optional
+            also retry objects still backing off, by default False
+
+        Returns
+        -------
+        int
+            number of objects deleted
+        """
+        with self._flush_lock:
+            now = time.time()
+            by_bucket: dict[str, list[str]] = defaultdict(list)
+            with self._lock:
+                for (bucket, object_name), (_, due) in self._pending.items():
+                    if force or due <= now:
+                        by_bucket[bucket].append(object_name)
+
+            deleted = 0
+            for bucket, object_names in by_bucket.items():
+                for start in range(0, len(object_names), DELETE_OBJECTS_MAX_KEYS):
+                    batch = object_names[start : start + DELETE_OBJECTS_MAX_KEYS]
+                    try:
+                        failed = set(self.aws_service.delete_files(bucket, batch))
+                    except Exception as e:
+                        logger.error(f"S3 cleanup: batch in {bucket} failed: {e}")
+                        failed = set(batch)
+                    deleted += self._settle(bucket, batch, failed)
+            return deleted
+
+    def _settle(self, bucket: str, batch: list[str], failed: set[str]) -> int:
+        now = time.time()
+        with self._lock:
+            self.batches += 1
+            done = [(bucket, name) for name in batch if name not in failed]
+            for key in done:
+                self._pending.pop(key, None)
+            self._forget(done)
+
+            retries = []
+            for name in failed:
+                attempts = self._pending.get((bucket, name), (0, now))[0] + 1
+                delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+                self._pending[(bucket, name)] = (attempts, now + delay)
+                retries.append((bucket, name, attempts, now + delay))
+            self._persist(retries)
+
+            self.deleted += len(done)
+            self.failed_attempts += len(failed)
+        if failed:
+            logger.warning(f"S3 cleanup: retrying {len(failed)} deletes in {bucket}")
+        return len(done)
+
+    def start(self) -> None:
+        """Start the background deleter, if it is not running yet."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="s3-cleanup", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the background deleter after a last delete pass.
+
+        Objects that could not be deleted stay in the persisted backlog.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            seconds to wait for the last pass, by default 10.0
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"S3 cleanup: delete pass failed: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "deleted": self.deleted,
+                "failed_attempts": self.failed_attempts,
+                "batches": self.batches,
+                "running": self._thread is not None and self._thread.is_alive(),
+            }
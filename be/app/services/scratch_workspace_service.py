@@ -0,0 +1,169 @@
+"""
+Per-job scratch directories for the file-based image flows.
+
+Every pipeline run writes its temporary files into its own directory, so
+concurrent posts never overwrite each other's `filename.png`, and the
+directory is removed when the run ends. The bytes written across all open
+workspaces of the process are capped at SCRATCH_MAX_BYTES.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+
+from app.errors.project_io_error import ProjectIOError
+from app.logging_config import get_logger
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+
+class ScratchWorkspace:
+    """
+    A temporary directory owned by a single pipeline run.
+
+    Use as a context manager; the directory and everything in it is deleted on
+    exit, even if the run failed.
+    """
+
+    def __init__(self, service: "ScratchWorkspaceService", path: str) -> None:
+        self.service = service
+        self.dir = path
+        self.used_bytes = 0
+        self.closed = False
+
+    def path(self, filename: str) -> str:
+        """
+        Path of a file inside this workspace.
+
+        Parameters
+        ----------
+        filename : str
+            file name, without directories
+
+        Returns
+        -------
+        str
+            the full path
+        """
+        return os.path.join(self.dir, os.path.basename(filename))
+
+    def write_bytes(self, filename: str, data: bytes) -> str:
+        """
+        Write a file into this workspace, within the disk-usage cap.
+
+        Parameters
+        ----------
+        filename : str
+            file name, without directories
+        data : bytes
+            file content
+
+        Returns
+        -------
+        str
+            the full path of the written file
+
+        Raises
+        ------
+        ProjectIOError
+            If the write would exceed SCRATCH_MAX_BYTES.
+        """
+        path = self.path(filename)
+        self.service.reserve(self, len(data))
+        with open(path, "wb") as handler:
+            handler.write(data)
+        return path
+
+    def track(self, path: str) -> str:
+        """
+        Account for a file written into this workspace by another library.
+
+        Parameters
+        ----------
+        path : str
+            path of the written file
+
+        Returns
+        -------
+        str
+            the same path
+
+        Raises
+        ------
+        ProjectIOError
+            If the file takes the process over SCRATCH_MAX_BYTES.
+        """
+        self.service.reserve(self, os.path.getsize(path))
+        return path
+
+    def cleanup(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.service.release(self)
+
+    def __enter__(self) -> "ScratchWorkspace":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cleanup()
+
+
+class ScratchWorkspaceService:
+    """
+    Creates scratch workspaces and enforces the process-wide disk-usage cap.
+    """
+
+    def __init__(self) -> None:
+        self.settings = Settings().get_settings()
+        self.root = os.path.join(
+            self.settings.SCRATCH_DIR or tempfile.gettempdir(), "stockly-scratch"
+        )
+        self.max_bytes = int(self.settings.SCRATCH_MAX_BYTES)
+
+        self._lock = threading.Lock()
+        self._used_bytes = 0
+        self._open_workspaces = 0
+
+    def workspace(self) -> ScratchWorkspace:
+        """
+        Create a new, empty workspace.
+
+        Returns
+        -------
+        ScratchWorkspace
+            the workspace; use it as a context manager
+        """
+        os.makedirs(self.root, exist_ok=True)
+        path = tempfile.mkdtemp(prefix="job-", dir=self.root)
+        with self._lock:
+            self._open_workspaces += 1
+        return ScratchWorkspace(self, path)
+
+    def reserve(self, workspace: ScratchWorkspace, nbytes: int) -> None:
+        with self._lock:
+            if self.max_bytes > 0 and self._used_bytes + nbytes > self.max_bytes:
+                raise ProjectIOError(
+                    f"Scratch disk cap of {self.max_bytes} bytes reached "
+                    f"({self._used_bytes} in use by {self._open_workspaces} jobs)"
+                )
+            self._used_bytes += nbytes
+            workspace.used_bytes += nbytes
+
+    def release(self, workspace: ScratchWorkspace) -> None:
+        with self._lock:
+            self._used_bytes -= workspace.used_bytes
+            self._open_workspaces -= 1
+        workspace.used_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "root": self.root,
+                "max_bytes": self.max_bytes,
+                "used_bytes": self._used_bytes,
+                "open_workspaces": self._open_workspaces,
+            }
@@ -0,0 +1,140 @@
+import hashlib
+import os
+from functools import lru_cache
+
+from app.logging_config import get_logger
+from app.models.request.generate_image_request import GenerateImageRequest
+from app.services.cache_service import ContentAddressedFileCache
+from app.services.openai_service import IMAGE_PROMPT_MODEL, OpenAIService
+from app.services.project_io_service import ProjectIoService
+from app.settings import Settings
+
+logger = get_logger(__name__)
+
+STOCK_ART_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# SLIDE_IMAGE_SOURCE values
+SOURCE_GENERATE = "generate"
+SOURCE_STOCK_ART = "stock_art"
+
+
+@lru_cache(maxsize=32)
+def stock_art_files(directory: str, sentiment: str) -> tuple[str, ...]:
+    """Sorted image files of the stock-art library for one sentiment."""
+    sentiment_dir = os.path.join(directory, sentiment)
+    if not os.path.isdir(sentiment_dir):
+        return ()
+    return tuple(
+        sorted(
+            os.path.join(sentiment_dir, name)
+            for name in os.listdir(sentiment_dir)
+            if name.lower().endswith(STOCK_ART_EXTENSIONS)
+        )
+    )
+
+
+class SlideImageService:
+    """
+    Provides the background image of a body slide.
+
+    Generated images are cached by a hash of the image request, so the same
+    prompt and sentiment (e.g. a retried cron run) do not hit DALL-E again.
+    The stock-art library (STOCK_ART_DIR/<sentiment>/*.png) is used instead of
+    generation in fast mode (SLIDE_IMAGE_SOURCE='stock_art'), and as a fallback
+    when generation fails.
+    """
+
+    def __init__(
+        self,
+        openai_service: OpenAIService,
+        project_io_service: ProjectIoService,
+        image_cache: ContentAddressedFileCache | None = None,
+    ) -> None:
+        self.settings = Settings().get_settings()
+        self.openai_service = openai_service
+        self.project_io_service = project_io_service
+        self.image_cache = image_cache
+
+    def get_image_bytes(self, request: GenerateImageRequest) -> bytes | None:
+        """
+        Get the encoded background image for a slide.
+
+        Parameters
+        ----------
+        request : GenerateImageRequest
+            text prompt and sentiment of the slide
+
+        Returns
+        -------
+        bytes | None
+            the encoded image, or None if it could not be generated and the
+            stock-art library has nothing for the sentiment
+        """
+        prompt_hash = self.prompt_hash(request)
+
+        if self.settings.SLIDE_IMAGE_SOURCE == SOURCE_STOCK_ART:
+            image_data = self.stock_art(request, prompt_hash)
+            if image_data is not None:
+                return image_data
+            logger.info(
+                f"No stock art for {request.sentiment.value}, generating instead"
+            )
+
+        if self.image_cache is not None:
+            image_data = self.image_cache.get(prompt_hash)
+            if image_data is not None:
+                logger.info(f"Generated image cache hit for {prompt_hash[:12]}")
+                return image_data
+
+        try:
+            image_url = self.openai_service.generate_image_prompt(request=request)
+            if image_url:
+                image_data = self.project_io_service.download_image_bytes(image_url)
+                if self.image_cache is not None:
+                    self.image_cache.set(prompt_hash, image_data)
+                return image_data
+        except Exception as e:
+            logger.error(f"Image generation failed: {e}")
+
+        image_data = self.stock_art(request, prompt_hash)
+        if image_data is not None:
+            logger.info(f"Falling back to stock art for {request.sentiment.value}")
+        return image_data
+
+    def stock_art(
+        self, request: GenerateImageRequest, prompt_hash: str
+    ) -> bytes | None:
+        """
+        Pick an image from the stock-art library for the request's sentiment.
+
+        The pick is derived from the prompt hash, so a given prompt always gets
+        the same picture while different prompts spread over the library.
+
+        Parameters
+        ----------
+        request : GenerateImageRequest
+            text prompt and sentiment of the slide
+        prompt_hash : str
+            hex digest from `prompt_hash`
+
+        Returns
+        -------
+        bytes | None
+            the encoded image, or None if the library has none for the sentiment
+        """
+        files = stock_art_files(self.settings.STOCK_ART_DIR, request.sentiment.value)
+        if not files:
+            return None
+        path = files[int(prompt_hash, 16) % len(files)]
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            logger.error(f"Could not read stock art {path}: {e}")
+            return None
+
+    @staticmethod
+    def prompt_hash(request: GenerateImageRequest) -> str:
+        """Content address of a generated image: model, sentiment and prompt."""
+        key = f"{IMAGE_PROMPT_MODEL}\n{request.sentiment.value}\n{request.text_prompt}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
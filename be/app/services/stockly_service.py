@@ -1,17 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+from functools import partial
+from typing import Callable, Iterator, TypeVar
 
 from httpx import get
-import requests
+from PIL import Image
 
 from app.errors.base_error import StocklyError
 from app.logging_config import get_logger
-from app.models.request.aws_service_request import (
-    DeleteImageRequest,
-    UploadImageRequest,
+from app.models.request.aws_service_request import UploadImageRequest
+from app.models.request.generate_image_request import (
+    GenerateImageRequest,
+    SentimentEnum,
 )
-from app.models.request.generate_image_request import GenerateImageRequest
 from app.models.request.instagram_service_request import InstagramCarouselRequest
 from app.models.request.send_briefing_email_request import SendEmailRequest
+from app.models.request.slide_render_request import SlideRenderRequest
 from app.models.request.stock_request import StockRequestInfo
 from app.models.response.base_response import ErrorResponse, SuccessResponse
 from app.services.aws_service import AWSService
@@ -20,12 +24,20 @@ from app.services.instagram_service import InstagramService
 from app.services.openai_service import OpenAIService
 from app.services.parser_service import ParserService
 from app.services.project_io_service import ProjectIoService
+from app.services.prompt_compaction_service import PromptCompactionService
+from app.services.s3_cleanup_service import S3CleanupService
+from app.services.scratch_workspace_service import ScratchWorkspaceService
+from app.services.slide_image_service import SlideImageService
 from app.settings import Settings
 from app.models.response.aws_service_response import S3StorageObject
 from app.services.fetch_logo_service import FetchLogoService
+from app.services.http_client_service import HttpClientService
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 CAPTION_HASHTAGS = [
     "stockly",
     "finance",
@@ -67,6 +79,11 @@ class StocklyService:
         aws_service: AWSService,
         instagram_service: InstagramService,
         fetch_logo_service: FetchLogoService,
+        http_client: HttpClientService,
+        prompt_compaction_service: PromptCompactionService,
+        scratch_workspace_service: ScratchWorkspaceService,
+        slide_image_service: SlideImageService,
+        s3_cleanup_service: S3CleanupService,
     ):
         self.email_service = email_service
         self.parser_service = parser_service
@@ -75,6 +92,11 @@ class StocklyService:
         self.aws_service = aws_service
         self.instagram_service = instagram_service
         self.fetch_logo_service = fetch_logo_service
+        self.http_client = http_client
+        self.prompt_compaction_service = prompt_compaction_service
+        self.scratch_workspace_service = scratch_workspace_service
+        self.slide_image_service = slide_image_service
+        self.s3_cleanup_service = s3_cleanup_service
 
         self.settings = Settings().get_settings()
 
@@ -92,15 +114,44 @@ class StocklyService:
         str
             The analysis of the stock.
         """
-        html_response = requests.get(self.settings.URL_NEWS + stock.full_name).text
-
-        cleaned_html = self.parser_service.format_html(stock, html_response)
+        cleaned_html = self._fetch_formatted_news(stock)
 
         chatgpt_response = self.openai_service.generate_written_prompt(
             stock.ticker, cleaned_html
         )
         return chatgpt_response
 
+    def stream_stock_analysis(self, stock: StockRequestInfo) -> Iterator[str]:
+        """
+        Stream the analysis of the given stock as it is generated.
+
+        Parameters
+        ----------
+        stock : StockRequestInfo
+            The stock request information.
+
+        Yields
+        ------
+        str
+            Text deltas of the analysis.
+        """
+        cleaned_html = self._fetch_formatted_news(stock)
+
+        yield from self.openai_service.stream_written_prompt(stock.ticker, cleaned_html)
+
+    def _fetch_formatted_news(self, stock: StockRequestInfo) -> str:
+        """Fetch the Google News page of the stock and reduce it to compacted plain text."""
+        html_response = self.http_client.get(
+            self.settings.URL_NEWS + stock.full_name
+        ).text
+
+        if int(self.settings.PROMPT_TOKEN_BUDGET) <= 0:
+            return self.parser_service.format_html(stock, html_response)
+
+        headlines = self.parser_service.extract_headlines(html_response)
+        compacted = self.prompt_compaction_service.compact(stock, headlines)
+        return self.parser_service.scrub(stock, compacted.text)
+
     def send_briefing_email(
         self,
         param: SendEmailRequest,
@@ -119,6 +170,10 @@ class StocklyService:
             Email sent successfully.
         """
         try:
+            analyses = self._analyse_unique_stocks(
+                [stock for request in param.user_requests for stock in request.stocks]
+            )
+
             for request in param.user_requests:
                 stocks = request.stocks
                 self.project_io_service.generate_intro(request.name)
@@ -126,15 +181,7 @@ class StocklyService:
                 for stock in stocks:
                     self.project_io_service.add_next_stock(stock)
 
-                    html_response = requests.get(
-                        self.settings.URL_NEWS + stock.full_name
-                    ).text
-
-                    cleaned_html = self.parser_service.format_html(stock, html_response)
-
-                    chatgpt_text = self.openai_service.generate_written_prompt(
-                        stock.ticker, cleaned_html
-                    )
+                    chatgpt_text = analyses.get(stock.full_name, "")
 
                     self.project_io_service.append_report(chatgpt_text + "\n\n")
 
@@ -152,6 +199,124 @@ class StocklyService:
         except StocklyError as e:
             return ErrorResponse(error_code=e.error_code, error_message=str(e))
 
+    def _analyse_unique_stocks(self, stocks: list[StockRequestInfo]) -> dict[str, str]:
+        """
+        Fetch and analyse each unique stock once, concurrently.
+
+        Parameters
+        ----------
+        stocks : list[StockRequestInfo]
+            All requested stocks, possibly with duplicates across users.
+
+        Returns
+        -------
+        dict[str, str]
+            Analysis keyed by the stock's full name (EXCHANGE:TICKER).
+        """
+        unique_stocks: dict[str, StockRequestInfo] = {}
+        for stock in stocks:
+            unique_stocks.setdefault(stock.full_name, stock)
+
+        max_workers = max(1, int(self.settings.BRIEFING_MAX_CONCURRENCY))
+        logger.info(
+            f"Analysing {len(unique_stocks)} unique stocks out of {len(stocks)} requested "
+            f"with concurrency {max_workers}"
+        )
+
+        analyses: dict[str, str] = {}
+        if not unique_stocks:
+            return analyses
+
+        batch_size = int(self.settings.BRIEFING_ANALYSIS_BATCH_SIZE)
+        if batch_size > 1:
+            return self._analyse_unique_stocks_batched(
+                unique_stocks, batch_size, max_workers
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_stock_analysis, stock): full_name
+                for full_name, stock in unique_stocks.items()
+            }
+            for future in as_completed(futures):
+                full_name = futures[future]
+                try:
+                    analyses[full_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to analyse {full_name}: {e}")
+                    analyses[full_name] = ""
+
+        return analyses
+
+    def _analyse_unique_stocks_batched(
+        self,
+        unique_stocks: dict[str, StockRequestInfo],
+        batch_size: int,
+        max_workers: int,
+    ) -> dict[str, str]:
+        """
+        Fetch news for each stock concurrently, then analyse them in batched requests.
+
+        Parameters
+        ----------
+        unique_stocks : dict[str, StockRequestInfo]
+            Stocks keyed by their full name (EXCHANGE:TICKER).
+        batch_size : int
+            Max number of stocks per OpenAI request.
+        max_workers : int
+            Max number of concurrent fetches / requests.
+
+        Returns
+        -------
+        dict[str, str]
+            Analysis keyed by the stock's full name (EXCHANGE:TICKER).
+        """
+        formatted_news: dict[str, str] = {}
+        analyses: dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_formatted_news, stock): full_name
+                for full_name, stock in unique_stocks.items()
+            }
+            for future in as_completed(futures):
+                full_name = futures[future]
+                try:
+                    formatted_news[full_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch news for {full_name}: {e}")
+                    analyses[full_name] = ""
+
+            fetched = [name for name in unique_stocks if name in formatted_news]
+            chunks = [
+                fetched[start : start + batch_size]
+                for start in range(0, len(fetched), batch_size)
+            ]
+            futures = {
+                executor.submit(
+                    self.openai_service.generate_written_prompts_batch,
+                    # labelled by full name, so e.g. NYSE:KO and LSE:KO get
+                    # separate sections, but cached by ticker
+                    [
+                        (name, unique_stocks[name].ticker, formatted_news[name])
+                        for name in chunk
+                    ],
+                    batch_size,
+                ): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to analyse batch {chunk}: {e}")
+                    results = {}
+                for name in chunk:
+                    analyses[name] = results.get(name, "")
+
+        return analyses
+
     def _add_hashtags_to_caption(self, caption: str, stock: StockRequestInfo) -> str:
         """Add relevant hashtags to the caption.
 
@@ -187,40 +352,162 @@ class StocklyService:
         logger.info(f"bolded: {bolded_text}")
         logger.info(f"text_overlay: {text_overlay}")
 
-        image_url = self.openai_service.generate_image_prompt(
-            request=image_request,
-        )
-        if image_url:
-            downloaded_file = self.project_io_service.download_image(image_url)
+        image_data = self.slide_image_service.get_image_bytes(image_request)
+        if image_data:
+            s3_object = self._create_s3_object_on_disk(
+                image_data, text_overlay=text_overlay, bolded_text=bolded_text
+            )
+            if s3_object:
+                return s3_object
+            else:
+                logger.error(
+                    f"Failed to upload image to S3 for prompt: {image_request.text_prompt} with sentiment: {image_request.sentiment}"
+                )
+                return None
+        else:
+            logger.error(
+                f"Failed to generate image for prompt: {image_request.text_prompt} with sentiment: {image_request.sentiment}"
+            )
+            return None
+
+    def _create_s3_object_on_disk(
+        self, image_data: bytes, text_overlay: str, bolded_text: str = ""
+    ) -> S3StorageObject | None:
+        """Disk-based slide flow, used when IMAGE_PIPELINE_MODE is 'disk'."""
+        with self.scratch_workspace_service.workspace() as workspace:
+            downloaded_file = workspace.write_bytes("filename.png", image_data)
             downloaded_file_with_text = self.project_io_service.text_overlay(
                 image_filepath=downloaded_file,
                 text=text_overlay,
                 bolded_text=bolded_text,
+                workspace=workspace,
             )
-            s3_object = self.aws_service.upload_file(
+            return self.aws_service.upload_file(
                 UploadImageRequest(
                     file_path=downloaded_file_with_text,
                     bucket=self.settings.AWS_BUCKET_NAME,
                 )
             )
-            if s3_object:
-                self.cleanup_temp_files(
-                    local_files=[
-                        downloaded_file,
-                        downloaded_file_with_text,
-                    ]
-                )
-                return s3_object
-            else:
-                logger.error(
-                    f"Failed to upload image to S3 for prompt: {image_request.text_prompt} with sentiment: {image_request.sentiment}"
-                )
-                return None
-        else:
+
+    def _generate_slide_image(
+        self, image_request: GenerateImageRequest
+    ) -> Image.Image | None:
+        """Get the background image of a slide and decode it in memory."""
+        logger.info(f"Generating image prompt for: {image_request.text_prompt}")
+        image_data = self.slide_image_service.get_image_bytes(image_request)
+        if not image_data:
             logger.error(
                 f"Failed to generate image for prompt: {image_request.text_prompt} with sentiment: {image_request.sentiment}"
             )
             return None
+        return self.project_io_service.decode_image(image_data)
+
+    def _generate_concurrently(
+        self, generate: Callable[[T], R], items: list[T]
+    ) -> list[R | None]:
+        """
+        Run a slide generation step for every item on a bounded thread pool.
+
+        Parameters
+        ----------
+        generate : Callable[[T], R]
+            The step, e.g. generating the DALL-E image of one slide.
+        items : list[T]
+            One item per slide, in carousel order.
+
+        Returns
+        -------
+        list[R | None]
+            The results in the order of `items`; None where the step failed,
+            without cancelling the other slides.
+        """
+        if not items:
+            return []
+
+        max_workers = max(
+            1, min(len(items), int(self.settings.IMAGE_GENERATION_MAX_CONCURRENCY))
+        )
+        logger.info(f"Generating {len(items)} slides with concurrency {max_workers}")
+        results: list[R | None] = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(generate, item): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to generate slide {index + 1}: {e}")
+        return results
+
+    def _create_carousel_in_memory(
+        self,
+        stock: StockRequestInfo,
+        company_logo_url: str | None,
+        intro_text: str,
+        slide_texts: list[tuple[str, str, str]],
+        sentiment: SentimentEnum,
+    ) -> list[str]:
+        """
+        Build every slide in memory, render them in parallel and upload them.
+
+        Parameters
+        ----------
+        stock : StockRequestInfo
+            The stock of the post.
+        company_logo_url : str | None
+            URL of the company logo; the intro slide is skipped without it.
+        intro_text : str
+            Bold text of the intro slide.
+        slide_texts : list[tuple[str, str, str]]
+            (prompt, header, body) of every body slide.
+        sentiment : SentimentEnum
+            Sentiment of the analysis, for image generation.
+
+        Returns
+        -------
+        list[str]
+            S3 object names of the uploaded slides, in carousel order.
+        """
+        slides: list[SlideRenderRequest] = []
+        if company_logo_url:
+            slides.append(
+                SlideRenderRequest(
+                    image=self.project_io_service.compose_intro_slide(
+                        stock.ticker,
+                        company_logo_url,
+                        load_logo=partial(
+                            self.fetch_logo_service.fetch_company_logo_bytes,
+                            stock.full_name,
+                        ),
+                    ),
+                    bolded_text=intro_text,
+                )
+            )
+
+        images = self._generate_concurrently(
+            lambda slide_text: self._generate_slide_image(
+                GenerateImageRequest(
+                    text_prompt=slide_text[0],
+                    sentiment=sentiment,
+                )
+            ),
+            slide_texts,
+        )
+        for (prompt, header, body), image in zip(slide_texts, images):
+            if image is not None:
+                slides.append(
+                    SlideRenderRequest(image=image, text=body, bolded_text=header)
+                )
+
+        s3_objects = self.aws_service.upload_fileobjs(
+            self.project_io_service.render_slides(slides),
+            bucket=self.settings.AWS_BUCKET_NAME,
+            content_type=self.project_io_service.slide_content_type(),
+        )
+        return [s3_object.object_name for s3_object in s3_objects]
 
     def create_end_to_end_post(
         self, stock: StockRequestInfo
@@ -264,37 +551,7 @@ class StocklyService:
             company_logo_url = self.fetch_logo_service.fetch_company_logo(
                 stock.full_name
             )
-            if company_logo_url:
-                company_logo_filepath = self.project_io_service.download_image(
-                    company_logo_url
-                )
-                overlaid_logo_path = self.project_io_service.image_overlay(
-                    background_image_path=self.settings.BACKGROUND_IMAGE_PATH,
-                    overlay_image_path=company_logo_filepath,
-                    output_file_path="overlaid_logo.png",
-                )
-                overlaid_logo_path_with_text = self.project_io_service.text_overlay(
-                    image_filepath=overlaid_logo_path,
-                    text="",
-                    bolded_text=intro_text,
-                )
-                logo_s3_object = self.aws_service.upload_file(
-                    UploadImageRequest(
-                        file_path=overlaid_logo_path_with_text,
-                        bucket=self.settings.AWS_BUCKET_NAME,
-                    )
-                )
-                if logo_s3_object:
-                    s3_object_names.append(logo_s3_object.object_name)
-
-                    self.cleanup_temp_files(
-                        local_files=[
-                            company_logo_filepath,
-                            overlaid_logo_path,
-                            overlaid_logo_path_with_text,
-                        ]
-                    )
-
+            slide_texts = []
             for prompt in body_text:
                 if "sentiment analysis" in prompt.lower() and "\n" in prompt:
                     header, body = prompt.split("\n", 1)
@@ -303,16 +560,36 @@ class StocklyService:
                 else:
                     header = ""
                     body = prompt
-                s3_object = self._create_s3_object_from_image_prompt(
-                    GenerateImageRequest(
-                        text_prompt=prompt,
-                        sentiment=sentiment,
+                slide_texts.append((prompt, header, body))
+
+            if self.settings.IMAGE_PIPELINE_MODE == "disk":
+                if company_logo_url:
+                    logo_s3_object = self._create_intro_s3_object_on_disk(
+                        stock, intro_text
+                    )
+                    if logo_s3_object:
+                        s3_object_names.append(logo_s3_object.object_name)
+
+                s3_objects = self._generate_concurrently(
+                    lambda slide_text: self._create_s3_object_from_image_prompt(
+                        GenerateImageRequest(
+                            text_prompt=slide_text[0],
+                            sentiment=sentiment,
+                        ),
+                        text_overlay=slide_text[2],
+                        bolded_text=slide_text[1],
                     ),
-                    text_overlay=body,
-                    bolded_text=header,
+                    slide_texts,
+                )
+                for s3_object in s3_objects:
+                    if s3_object:
+                        s3_object_names.append(s3_object.object_name)
+            else:
+                s3_object_names.extend(
+                    self._create_carousel_in_memory(
+                        stock, company_logo_url, intro_text, slide_texts, sentiment
+                    )
                 )
-                if s3_object:
-                    s3_object_names.append(s3_object.object_name)
 
             s3_object_names.append(self.settings.LAST_INSTAGRAM_PICTURE_S3_NAME)
 
@@ -335,21 +612,51 @@ class StocklyService:
 
         return res
 
+    def _create_intro_s3_object_on_disk(
+        self, stock: StockRequestInfo, intro_text: str
+    ) -> S3StorageObject | None:
+        """Disk-based intro slide flow, used when IMAGE_PIPELINE_MODE is 'disk'."""
+        with self.scratch_workspace_service.workspace() as workspace:
+            company_logo_filepath = workspace.write_bytes(
+                "filename.png",
+                self.fetch_logo_service.fetch_company_logo_bytes(stock.full_name),
+            )
+            overlaid_logo_path = self.project_io_service.image_overlay(
+                background_image_path=self.settings.BACKGROUND_IMAGE_PATH,
+                overlay_image_path=company_logo_filepath,
+                output_file_path="overlaid_logo.png",
+                workspace=workspace,
+            )
+            overlaid_logo_path_with_text = self.project_io_service.text_overlay(
+                image_filepath=overlaid_logo_path,
+                text="",
+                bolded_text=intro_text,
+                workspace=workspace,
+            )
+            return self.aws_service.upload_file(
+                UploadImageRequest(
+                    file_path=overlaid_logo_path_with_text,
+                    bucket=self.settings.AWS_BUCKET_NAME,
+                )
+            )
+
     def cleanup_temp_files(
         self, s3_object_names: list[str] = [], local_files: list[str] = []
     ):
         """
         Cleanup temporary files created during processing.
+
+        S3 objects are only queued here; they are deleted in the background.
         """
         # Cleanup S3 bucket
-        for s3_object_name in s3_object_names:
-            if s3_object_name != self.settings.LAST_INSTAGRAM_PICTURE_S3_NAME:
-                self.aws_service.delete_file(
-                    param=DeleteImageRequest(
-                        bucket=self.settings.AWS_BUCKET_NAME,
-                        object_name=s3_object_name,
-                    )
-                )
+        self.s3_cleanup_service.enqueue(
+            bucket=self.settings.AWS_BUCKET_NAME,
+            object_names=[
+                s3_object_name
+                for s3_object_name in s3_object_names
+                if s3_object_name != self.settings.LAST_INSTAGRAM_PICTURE_S3_NAME
+            ],
+        )
         # Cleanup local files
         for local_file in local_files:
             self.project_io_service.delete_file(filename=local_file)
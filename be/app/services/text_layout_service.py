@@ -0,0 +1,239 @@
+"""
+Pixel-width text layout for slide overlays.
+
+Text is wrapped by measured width instead of character count, using word
+widths and line boxes cached per font, and the font size can be shrunk until
+the text block fits a target box.
+"""
+
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from app.logging_config import get_logger
+from app.services.font_service import Font, FontService
+
+logger = get_logger(__name__)
+
+
+class LayoutLine(BaseModel):
+    text: str
+    is_bold: bool
+    width: int
+    height: int
+
+
+class TextLayout(BaseModel):
+    size: int
+    lines: list[LayoutLine]
+    line_spacing: int
+    height: int
+    fits: bool
+
+
+# Fonts are process-wide singletons (see FontService), so caching by font
+# object is the same as caching by (path, size).
+@lru_cache(maxsize=65536)
+def word_length(font: Font, word: str) -> float:
+    return font.getlength(word)
+
+
+@lru_cache(maxsize=8192)
+def line_box(font: Font, line: str) -> tuple[int, int]:
+    # a blank line takes the height of a space
+    left, top, right, bottom = font.getbbox(line or " ")
+    return right - left, bottom - top
+
+
+class TextLayoutService:
+    """
+    Wraps overlay text to a pixel width and fits the font size to a box.
+    """
+
+    def __init__(self, font_service: FontService) -> None:
+        self.font_service = font_service
+
+    def layout(
+        self,
+        text: str,
+        bolded_text: str,
+        size: int,
+        max_width: int,
+        line_spacing: int = 6,
+        max_height: int | None = None,
+    ) -> TextLayout:
+        """
+        Wrap the bold header and the body text to `max_width` pixels.
+
+        Parameters
+        ----------
+        text : str
+            body text, drawn with the regular font
+        bolded_text : str
+            header text, drawn first with the bold font
+        size : int
+            font size
+        max_width : int
+            max line width in pixels
+        line_spacing : int, optional
+            pixels between lines, by default 6
+        max_height : int | None, optional
+            height of the target box, only used to fill `TextLayout.fits`
+
+        Returns
+        -------
+        TextLayout
+            the lines with their measured sizes
+        """
+        lines: list[LayoutLine] = []
+        for paragraphs, is_bold in (
+            ((bolded_text or "").strip(), True),
+            (text or "", False),
+        ):
+            font = (
+                self.font_service.get_bold_font(size)
+                if is_bold
+                else self.font_service.get_font(size)
+            )
+            for paragraph in paragraphs.splitlines():
+                paragraph = paragraph.strip()
+                if not paragraph:
+                    lines.append(self._line(font, "", is_bold))
+                    continue
+                for line in self.wrap(font, paragraph, max_width):
+                    lines.append(self._line(font, line, is_bold))
+
+        height = sum(line.height for line in lines) + line_spacing * (len(lines) - 1)
+        return TextLayout(
+            size=size,
+            lines=lines,
+            line_spacing=line_spacing,
+            height=max(0, height),
+            fits=max_height is None or height <= max_height,
+        )
+
+    def fit(
+        self,
+        text: str,
+        bolded_text: str,
+        max_size: int,
+        min_size: int,
+        max_width: int,
+        max_height: int,
+        line_spacing: int = 6,
+    ) -> TextLayout:
+        """
+        Lay out the text at the largest size in [min_size, max_size] that fits the box.
+
+        Parameters
+        ----------
+        text : str
+            body text
+        bolded_text : str
+            header text
+        max_size : int
+            preferred font size
+        min_size : int
+            smallest allowed font size
+        max_width : int
+            box width in pixels
+        max_height : int
+            box height in pixels
+        line_spacing : int, optional
+            pixels between lines, by default 6
+
+        Returns
+        -------
+        TextLayout
+            the fitting layout, or the `min_size` layout if nothing fits
+        """
+        best = self.layout(
+            text, bolded_text, max_size, max_width, line_spacing, max_height
+        )
+        if best.fits or min_size >= max_size:
+            return best
+
+        # text height shrinks with the font size, so binary search the sizes
+        low, high = min_size, max_size - 1
+        best = None
+        while low <= high:
+            size = (low + high) // 2
+            candidate = self.layout(
+                text, bolded_text, size, max_width, line_spacing, max_height
+            )
+            if candidate.fits:
+                best = candidate
+                low = size + 1
+            else:
+                high = size - 1
+
+        if best is None:
+            logger.info(f"Text does not fit {max_width}x{max_height} even at {min_size}")
+            best = self.layout(
+                text, bolded_text, min_size, max_width, line_spacing, max_height
+            )
+        elif best.size < max_size:
+            logger.info(f"Shrunk overlay text from {max_size} to {best.size} to fit")
+        return best
+
+    def wrap(self, font: Font, paragraph: str, max_width: int) -> list[str]:
+        """
+        Greedily wrap a paragraph on words so each line is at most `max_width` wide.
+
+        Words wider than a line are broken on characters.
+
+        Parameters
+        ----------
+        font : Font
+            font the text is drawn with
+        paragraph : str
+            a single paragraph
+        max_width : int
+            max line width in pixels
+
+        Returns
+        -------
+        list[str]
+            the lines
+        """
+        space = word_length(font, " ")
+        lines: list[str] = []
+        current: list[str] = []
+        current_width = 0.0
+
+        for word in paragraph.split():
+            width = word_length(font, word)
+            if width > max_width:
+                if current:
+                    lines.append(" ".join(current))
+                pieces = self._break_word(font, word, max_width)
+                lines.extend(pieces[:-1])
+                current = [pieces[-1]]
+                current_width = word_length(font, pieces[-1])
+            elif current and current_width + space + width > max_width:
+                lines.append(" ".join(current))
+                current = [word]
+                current_width = width
+            else:
+                current_width += (space if current else 0) + width
+                current.append(word)
+
+        if current:
+            lines.append(" ".join(current))
+        return lines
+
+    def _break_word(self, font: Font, word: str, max_width: int) -> list[str]:
+        pieces: list[str] = []
+        start = 0
+        for end in range(1, len(word) + 1):
+            if end - start > 1 and font.getlength(word[start:end]) > max_width:
+                pieces.append(word[start : end - 1])
+                start = end - 1
+        pieces.append(word[start:])
+        return pieces
+
+    def _line(self, font: Font, line: str, is_bold: bool) -> LayoutLine:
+        width, height = line_box(font, line)
+        return LayoutLine(
+            text=line, is_bold=is_bold, width=0 if not line else width, height=height
+        )
@@ -14,6 +14,47 @@ class MODE(enum.Enum):
 class Settings(BaseModel):
     ORG_NAME: str = "Stockly"
     BACKGROUND_IMAGE_PATH: str = "app/assets/bg_image.jpg"
+    # Slide pipeline: 'memory' (PIL images and buffers) or 'disk' (temp files)
+    IMAGE_PIPELINE_MODE: str = "memory"
+    SLIDE_RENDER_WORKERS: int = 4
+    # Max DALL-E slide images generated at the same time
+    IMAGE_GENERATION_MAX_CONCURRENCY: int = 4
+    # Slide images: 'generate' (DALL-E, cached by prompt hash) or 'stock_art' (fast
+    # mode: STOCK_ART_DIR/<sentiment>/*.png, generating only if that is empty)
+    SLIDE_IMAGE_SOURCE: str = "generate"
+    STOCK_ART_DIR: str = "app/assets/stock_art"
+    GENERATED_IMAGE_CACHE_MAX_BYTES: int = 536870912
+    # Overlay text is shrunk down to TEXT_MIN_FONT_SIZE to fit this share of the slide height
+    TEXT_BOX_HEIGHT_RATIO: float = 0.6
+    TEXT_MIN_FONT_SIZE: int = 22
+    # Overlay text readability: 'stroke' (outlined glyphs) or 'band' (darkened gradient band)
+    TEXT_READABILITY: str = "stroke"
+    TEXT_BAND_OPACITY: float = 0.6
+    TEXT_BAND_FADE: int = 120
+    # Slide encoding: 'png', 'jpeg' or 'webp'
+    SLIDE_IMAGE_FORMAT: str = "png"
+    SLIDE_IMAGE_QUALITY: int = 88
+    SLIDE_JPEG_SUBSAMPLING: str = "4:2:0"
+    SLIDE_WEBP_METHOD: int = 4
+    SLIDE_PNG_COMPRESS_LEVEL: int = 6
+    # Per-job scratch directories for file-based flows; empty means the system temp dir
+    SCRATCH_DIR: str = ""
+    SCRATCH_MAX_BYTES: int = 536870912
+
+    # Local caches
+    CACHE_DIR: str = ".cache"
+    COMPANY_METADATA_TTL_SECONDS: int = 86400
+    COMPANY_METADATA_CACHE_MAX_ENTRIES: int = 2048
+    INTRO_LOGO_CACHE_TTL_SECONDS: int = 2592000
+    INTRO_LOGO_CACHE_MAX_ENTRIES: int = 1024
+    LOGO_CACHE_TTL_SECONDS: int = 2592000
+    LOGO_NEGATIVE_CACHE_TTL_SECONDS: int = 86400
+    LOGO_CACHE_MAX_ENTRIES: int = 2048
+    LOGO_WARMUP_CONCURRENCY: int = 4
+    # Stop reading the Google Images page after this many characters
+    LOGO_PAGE_MAX_CHARS: int = 2097152
+    ANALYSIS_CACHE_TTL_SECONDS: int = 21600
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 1024
 
     # Endpoints
     BACKEND_URL: str = "0.0.0.0"
@@ -27,10 +68,22 @@ class Settings(BaseModel):
     CONTENT_PREFIX: str = (
         "Dear {},\n\nGood morning from all of us at {}! Here is our curated summary for you:\n\n# Report of your selected stocks:\n\n"
     )
+    # Max number of stocks fetched and analysed at the same time
+    BRIEFING_MAX_CONCURRENCY: int = 8
+    # Stocks analysed per OpenAI request; 0 or 1 sends one request per stock
+    BRIEFING_ANALYSIS_BATCH_SIZE: int = 0
+
+    # Prompt compaction; a token budget of 0 disables compaction
+    PROMPT_TOKEN_BUDGET: int = 1500
+    PROMPT_DUPLICATE_THRESHOLD: float = 0.8
+    PROMPT_MINHASH_PERMUTATIONS: int = 64
+    PROMPT_SHINGLE_SIZE: int = 3
 
     # OpenAI
     OPENAI_API_KEY: str = "OPENAI_API_KEY"
     OPENAI_URL: str = "https://api.openai.com/v1/chat/completions"
+    # Overrides HTTP_TIMEOUT_SECONDS for OpenAI calls (the SDK's own default)
+    OPENAI_TIMEOUT_SECONDS: float = 600.0
 
     # Instagram
     INSTA_USER_ID: str = "user"
@@ -48,7 +101,15 @@ class Settings(BaseModel):
     # Mode: 'live' or 'dev' - controls dev-only routes/features
     ENV_MODE: str = MODE.LIVE.value
 
+    # Shared HTTP client
+    HTTP_TIMEOUT_SECONDS: float = 60.0
+    HTTP_MAX_CONNECTIONS: int = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
     URL_NEWS: str = "https://news.google.com/search?q="
+    # News page extractor: 'streaming' (single pass) or 'soup' (BeautifulSoup tree)
+    HTML_EXTRACTOR: str = "streaming"
     URL_STOCKS: str = "https://www.google.com/finance/quote/"
 
     TNC_EFFECTIVE_DATE: str = "2024-01-01"
@@ -57,6 +118,16 @@ class Settings(BaseModel):
     AWS_ACCESS_KEY: str = ""
     AWS_SECRET: str = ""
     AWS_REGION: str = "us-east-1"
+    # Slide uploads: parallel uploads per carousel and boto3 transfer settings
+    S3_UPLOAD_CONCURRENCY: int = 8
+    S3_TRANSFER_MAX_CONCURRENCY: int = 10
+    S3_MULTIPART_THRESHOLD_BYTES: int = 8388608
+    S3_MULTIPART_CHUNKSIZE_BYTES: int = 8388608
+    S3_MAX_POOL_CONNECTIONS: int = 32
+    # Temporary slide objects are deleted in the background, in batches
+    S3_CLEANUP_INTERVAL_SECONDS: float = 30.0
+    S3_CLEANUP_RETRY_BASE_SECONDS: float = 30.0
+    S3_CLEANUP_RETRY_MAX_SECONDS: float = 3600.0
 
     DEEPSEEK_KEY: str = ""
     GEMINI_KEY: str = ""
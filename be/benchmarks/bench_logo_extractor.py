@@ -0,0 +1,56 @@
+"""
+Benchmark the logo extraction of FetchLogoService.
+
+Compares parsing the whole Google Images page with BeautifulSoup and
+`find_all("img")` against the streaming extractor that stops at the second
+img tag, on pages of growing size, and checks that both pick the same image.
+
+Usage (from `be/`):
+    python -m benchmarks.bench_logo_extractor
+"""
+
+import argparse
+import timeit
+
+from bs4 import BeautifulSoup
+
+from app.services.logo_html_extractor import extract_image_sources
+from benchmarks.fixtures import synthetic_images_page
+
+CHUNK_SIZE = 8192
+
+
+def soup_sources(html: str) -> list[str | None]:
+    images = BeautifulSoup(html, "html.parser").find_all("img")
+    return [img.get("src") for img in images[:2]]
+
+
+def streaming_sources(html: str) -> list[str | None]:
+    chunks = (html[i : i + CHUNK_SIZE] for i in range(0, len(html), CHUNK_SIZE))
+    return extract_image_sources(chunks, limit=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'page':>10} {'size':>10} {'soup ms':>10} {'stream ms':>10} {'speedup':>8}")
+    for results in (20, 100, 400):
+        html = synthetic_images_page(results=results, seed=results)
+        assert soup_sources(html) == streaming_sources(html), "extractors disagree"
+
+        soup = min(
+            timeit.repeat(lambda: soup_sources(html), number=1, repeat=args.repeat)
+        )
+        stream = min(
+            timeit.repeat(lambda: streaming_sources(html), number=1, repeat=args.repeat)
+        )
+        print(
+            f"{results:>10} {len(html):>10} {soup * 1000:>10.2f} "
+            f"{stream * 1000:>10.3f} {soup / stream:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the news page extractors of ParserService.
+
+Compares the BeautifulSoup tree scan with the single-pass streaming extractor
+on the fixture pages, and checks that both return the same texts.
+
+Usage (from `be/`):
+    python -m benchmarks.bench_parser
+    python -m benchmarks.bench_parser --record NASDAQ:AAPL
+"""
+
+import argparse
+import timeit
+
+from app.services.news_html_extractor import extract_first_child_div_texts
+from app.services.parser_service import ParserService
+from benchmarks.fixtures import load_pages, record_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--record",
+        metavar="EXCHANGE:TICKER",
+        help="record the Google News page of a stock as a fixture and exit",
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        from app.settings import Settings
+
+        url = Settings().get_settings().URL_NEWS + args.record
+        print(f"Recorded {record_page(url, args.record.replace(':', '_'))}")
+        return
+
+    parser_service = ParserService()
+    print(f"{'page':<30}{'KiB':>8}{'soup ms':>12}{'stream ms':>12}{'speedup':>10}  same")
+    for name, html in load_pages().items():
+        soup_texts = parser_service._extract_headlines_soup(html)
+        stream_texts = extract_first_child_div_texts(html)
+
+        soup_s = min(
+            timeit.repeat(
+                lambda: parser_service._extract_headlines_soup(html),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        stream_s = min(
+            timeit.repeat(
+                lambda: extract_first_child_div_texts(html),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{name:<30}{len(html) / 1024:>8.0f}{soup_s * 1000:>12.2f}"
+            f"{stream_s * 1000:>12.2f}{soup_s / stream_s:>9.1f}x  "
+            f"{soup_texts == stream_texts}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the text readability modes of ProjectIoService.render_text_overlay.
+
+'stroke' outlines every glyph with FreeType stroking; 'band' darkens one
+gradient band behind the text block with NumPy and draws plain text. Both are
+timed on the same slides, text drawing only (no PNG encoding).
+
+Usage (from `be/`):
+    python -m benchmarks.bench_readability
+    python -m benchmarks.bench_readability --save /tmp/slides  # to eyeball the output
+"""
+
+import argparse
+import os
+import timeit
+
+from PIL import Image
+
+from app.dependencies import get_project_io_service
+from app.services.project_io_service import READABILITY_BAND, READABILITY_STROKE
+
+SLIDES = [
+    ("Apple Inc. (NASDAQ:AAPL) Analysis:", ""),
+    (
+        "Summary",
+        "Apple reported record services revenue, offsetting softer iPhone sales in "
+        "China. The company also announced a larger buyback and raised its dividend.",
+    ),
+    (
+        "Sentiment Analysis: Positive",
+        "Analysts expect margins to keep expanding as services grow faster than "
+        "hardware. " * 4,
+    ),
+]
+
+
+def slide_background(seed: int) -> Image.Image:
+    # noisy background, closer to a generated picture than a flat colour
+    return Image.effect_noise((1024, 1024), 60 + seed).convert("RGB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--save", help="directory to write the rendered slides to")
+    args = parser.parse_args()
+
+    project_io_service = get_project_io_service()
+    backgrounds = [slide_background(i) for i in range(len(SLIDES))]
+
+    def render(readability: str) -> list[Image.Image]:
+        return [
+            project_io_service.render_text_overlay(
+                background.copy(),
+                text=text,
+                bolded_text=bolded_text,
+                readability=readability,
+            )
+            for background, (bolded_text, text) in zip(backgrounds, SLIDES)
+        ]
+
+    results = {}
+    for readability in (READABILITY_STROKE, READABILITY_BAND):
+        render(readability)  # warm the font and layout caches
+        results[readability] = min(
+            timeit.repeat(lambda: render(readability), number=args.number, repeat=5)
+        )
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            for i, image in enumerate(render(readability)):
+                image.save(os.path.join(args.save, f"slide_{i}_{readability}.png"))
+
+    per_slide = {k: v / args.number / len(SLIDES) * 1000 for k, v in results.items()}
+    print(
+        f"{len(SLIDES)} slides: stroke {per_slide[READABILITY_STROKE]:.1f} ms/slide, "
+        f"band {per_slide[READABILITY_BAND]:.1f} ms/slide "
+        f"({results[READABILITY_STROKE] / results[READABILITY_BAND]:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
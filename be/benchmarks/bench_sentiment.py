@@ -0,0 +1,109 @@
+"""
+Check and benchmark ParserService.find_sentiment against the previous
+recursive implementation.
+
+The equivalence check is property based: random texts are generated from the
+sentiment keywords, the "sentiment" anchor, fragments that make words overlap
+(e.g. "disastrousentiment"), mixed case and filler, and both implementations
+must agree on every one of them.
+
+Usage (from `be/`):
+    python -m benchmarks.bench_sentiment
+"""
+
+import argparse
+import random
+import timeit
+
+from app.models.request.generate_image_request import SentimentEnum
+from app.services.parser_service import ParserService
+
+FRAGMENTS = [
+    "sentiment",
+    "Sentiment Analysis:",
+    "ecstatic",
+    "disastrous",
+    "positive",
+    "NEGATIVE",
+    "neutral",
+    "disastrou",
+    "sentimen",
+    "s",
+    "t",
+    " ",
+    "\n",
+    "### ",
+    "the outlook is ",
+    "İ",
+    "ſentiment",
+]
+
+
+def find_sentiment_recursive(text: str) -> SentimentEnum:
+    """The previous implementation, kept as the reference."""
+    text = text.lower()
+
+    if text.find("sentiment") != -1:
+        narrowed_text = text[text.find("sentiment") + len("sentiment") :]
+        sentiment_of_narrowed_text = find_sentiment_recursive(narrowed_text)
+        if sentiment_of_narrowed_text != SentimentEnum.NEUTRAL:
+            return sentiment_of_narrowed_text
+
+    first_instances = {
+        SentimentEnum.ECSTATIC: text.find("ecstatic"),
+        SentimentEnum.DISASTROUS: text.find("disastrous"),
+        SentimentEnum.POSITIVE: text.find("positive"),
+        SentimentEnum.NEGATIVE: text.find("negative"),
+        SentimentEnum.NEUTRAL: text.find("neutral"),
+    }
+    first_instances = {k: v for k, v in first_instances.items() if v != -1}
+
+    if first_instances:
+        return min(first_instances, key=lambda k: first_instances[k])
+    return SentimentEnum.NEUTRAL
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--examples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    parser_service = ParserService()
+    rng = random.Random(args.seed)
+
+    for _ in range(args.examples):
+        text = random_text(rng)
+        expected = find_sentiment_recursive(text)
+        actual = parser_service.find_sentiment(text)
+        if actual != expected:
+            raise SystemExit(f"Mismatch on {text!r}: {actual} != {expected}")
+    print(f"find_sentiment matches the recursive implementation on {args.examples} texts")
+
+    # worst case for the recursive version: many anchors, keywords far apart
+    analyses = [
+        ("### Sentiment Analysis: " + "filler " * 200 + "neutral ") * 20 + "positive",
+        ("The sentiment is mixed. " * 50) + "Sentiment Analysis: Negative",
+    ] * 50
+
+    recursive_s = min(
+        timeit.repeat(
+            lambda: [find_sentiment_recursive(t) for t in analyses], number=5, repeat=5
+        )
+    )
+    scanner_s = min(
+        timeit.repeat(lambda: parser_service.find_sentiments(analyses), number=5, repeat=5)
+    )
+    print(
+        f"{len(analyses)} analyses: recursive {recursive_s / 5 * 1000:.1f} ms, "
+        f"single pass {scanner_s / 5 * 1000:.1f} ms "
+        f"({recursive_s / scanner_s:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
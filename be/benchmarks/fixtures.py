@@ -0,0 +1,166 @@
+"""
+Fixture pages for the benchmarks.
+
+Pages are read from `benchmarks/fixtures/*.html` (see `record_page`) and run
+alongside synthetic pages shaped like a Google News search result.
+`google_news_handwritten.html` reproduces the markup patterns of a real result
+page (custom elements, inline scripts holding markup, templates, unclosed and
+self-closing tags, entities); recorded pages can be added next to it.
+"""
+
+import random
+import re
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Per-session tokens of recorded pages: CSP nonces and tracking query parameters
+SANITIZE_PATTERNS = [
+    (re.compile(r'nonce="[^"]*"'), 'nonce="REDACTED"'),
+    (
+        re.compile(r"([?&;](?:ved|usg|ei|sca_esv|sxsrf|gs_lcrp)=)[^&\"'\s]*"),
+        r"\1REDACTED",
+    ),
+]
+
+WORDS = (
+    "shares stock rally falls earnings beat miss guidance analysts upgrade "
+    "downgrade revenue quarter outlook market investors dividend buyback chip "
+    "demand supply growth record slump report fed rates inflation deal merger"
+).split()
+
+
+def synthetic_news_page(articles: int = 120, seed: int = 0) -> str:
+    """
+    Build a Google-News-like page: deeply nested divs, scripts, styles and links.
+
+    Parameters
+    ----------
+    articles : int, optional
+        number of article cards, by default 120
+    seed : int, optional
+        random seed, by default 0
+
+    Returns
+    -------
+    str
+        the HTML page
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<!doctype html><html><head><title>Google News</title>",
+        "<style>.c-wiz{display:block}</style>",
+        "<script>window.WIZ_global_data = {" + "x" * 5000 + "};</script>",
+        "</head><body><div><div>For you</div><div>Following</div></div><main>",
+    ]
+    for i in range(articles):
+        headline = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+        source = rng.choice(["Reuters", "Bloomberg", "CNBC", "Yahoo Finance"])
+        parts.append(
+            f'<c-wiz><div class="card"><div class="inner"><article>'
+            f'<div><div><a href="./articles/{i}">{headline.capitalize()} &amp; more</a>'
+            f"</div><div><span>{source}</span><time>{rng.randint(1, 23)} hours ago</time>"
+            f'</div></div><div><img src="https://img/{i}.jpg"><script>track({i})</script>'
+            f"</div></article></div></div></c-wiz>"
+        )
+    parts.append("</main><div><div>About Google</div></div></body></html>")
+    return "".join(parts)
+
+
+def synthetic_images_page(results: int = 100, seed: int = 0) -> str:
+    """
+    Build a Google-Images-like page: a large inline script, then result thumbnails.
+
+    Parameters
+    ----------
+    results : int, optional
+        number of image results, by default 100
+    seed : int, optional
+        random seed, by default 0
+
+    Returns
+    -------
+    str
+        the HTML page
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<!doctype html><html><head><title>logo - Google Search</title>",
+        "<style>.islrc{display:flex}</style>",
+        "<script>var s='<img src=fake>';" + "x" * 20000 + "</script>",
+        '</head><body><div><a href="/"><img src="/images/branding/googlelogo.png"'
+        ' alt="Google"></a></div><div class="islrc">',
+    ]
+    for i in range(results):
+        thumbnail = "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=800))
+        parts.append(
+            f'<div class="isv-r"><a href="/imgres?{i}"><img alt="logo {i}" '
+            f'src="data:image/jpeg;base64,{thumbnail}"></a>'
+            f"<div>{' '.join(rng.choice(WORDS) for _ in range(8))}</div></div>"
+        )
+    parts.append("</div></body></html>")
+    return "".join(parts)
+
+
+def load_pages() -> dict[str, str]:
+    """
+    Load the fixture pages and the synthetic pages.
+
+    Returns
+    -------
+    dict[str, str]
+        page HTML keyed by name
+    """
+    pages = {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(FIXTURES_DIR.glob("*.html"))
+    }
+    pages["synthetic_small"] = synthetic_news_page(articles=40)
+    pages["synthetic_large"] = synthetic_news_page(articles=400, seed=1)
+    return pages
+
+
+def sanitize_page(html: str) -> str:
+    """
+    Redact per-session tokens from a recorded page, keeping its markup intact.
+
+    Parameters
+    ----------
+    html : str
+        the recorded page
+
+    Returns
+    -------
+    str
+        the page with nonces and tracking parameters redacted
+    """
+    for pattern, replacement in SANITIZE_PATTERNS:
+        html = pattern.sub(replacement, html)
+    return html
+
+
+def record_page(url: str, name: str) -> Path:
+    """
+    Download a live page into the fixtures directory, sanitized.
+
+    Parameters
+    ----------
+    url : str
+        page to record, e.g. a Google News search url
+    name : str
+        file name without extension
+
+    Returns
+    -------
+    Path
+        path of the recorded fixture
+    """
+    import httpx
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    path = FIXTURES_DIR / f"{name}.html"
+    path.write_text(
+        sanitize_page(httpx.get(url, follow_redirects=True, timeout=30).text),
+        encoding="utf-8",
+    )
+    return path